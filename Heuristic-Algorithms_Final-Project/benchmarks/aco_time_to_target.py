@@ -0,0 +1,96 @@
+# Time to target of the ant colony solvers with the ant system update (every ant deposits)
+# against the MAX-MIN Ant System rule, on random instances of a fixed seed. The target of
+# each problem is the value of a simple greedy construction, tightened where the greedy
+# value is reached in the first iterations (scheduling) or is close to optimal
+# (knapsack); a run stops as soon as it reaches the target or runs out of its time budget.
+#
+#   cd Heuristic-Algorithms_Final-Project
+#   python -m benchmarks.aco_time_to_target
+import random
+import time
+
+import numpy as np
+
+from heuristics import (MaxMinAntSystem, StoppingCriteria, ant_colony_bin_packing, ant_colony_job_scheduling_batched,
+                        ant_colony_knapsack, ant_colony_optimization)
+
+NUM_RUNS = 5
+MAX_TIME = 10.0
+
+RULES = {
+    "as": None,
+    "mmas": MaxMinAntSystem(deposit="iteration", reinit_after=50),
+    "mmas-gb": MaxMinAntSystem(deposit="global", reinit_after=50),
+}
+
+def run(name, solver, target, minimize=True, **kwargs):
+    for rule, mmas in RULES.items():
+        times = []
+        for seed in range(NUM_RUNS):
+            random.seed(seed)
+            stopping = StoppingCriteria(max_time=MAX_TIME, target=target)
+            start = time.perf_counter()
+            _, best = solver(stopping=stopping, mmas=mmas, **kwargs)
+            elapsed = time.perf_counter() - start
+            if best <= target if minimize else best >= target:
+                times.append(elapsed)
+        mean = f"{sum(times) / len(times):8.3f}s" if times else "       -"
+        print(f"{name:<16} {rule:<8} target={target:<10} reached={len(times)}/{NUM_RUNS} mean time={mean}")
+
+def greedy_makespan(processing_times):
+    loads = np.zeros(processing_times.shape[1])
+    for row in processing_times:
+        machine = (loads + row).argmin()
+        loads[machine] += row[machine]
+    return loads.max().item()
+
+def first_fit_decreasing(items, capacity):
+    loads = []
+    for item in sorted(items, reverse=True):
+        for i, load in enumerate(loads):
+            if load + item <= capacity:
+                loads[i] += item
+                break
+        else:
+            loads.append(item)
+    return len(loads)
+
+def greedy_set_cover(universe, subsets):
+    uncovered = set(universe)
+    cost = 0
+    while uncovered:
+        subset = min((s for s in subsets if s["set"] & uncovered), key=lambda s: s["cost"] / len(s["set"] & uncovered))
+        uncovered -= subset["set"]
+        cost += subset["cost"]
+    return cost
+
+def greedy_knapsack(items, capacity):
+    value = 0
+    for weight, item_value in sorted(items, key=lambda item: item[1] / item[0], reverse=True):
+        if weight <= capacity:
+            capacity -= weight
+            value += item_value
+    return value
+
+if __name__ == "__main__":
+    rng = random.Random(42)
+
+    processing_times = np.array([[rng.randint(1, 100) for _ in range(10)] for _ in range(200)], dtype=float)
+    run("job scheduling", ant_colony_job_scheduling_batched, round(0.75 * greedy_makespan(processing_times)),
+        processing_times=processing_times, num_ants=20, num_iterations=10000, rho=0.1)
+
+    items = [rng.randint(5, 60) for _ in range(120)]
+    run("bin packing", ant_colony_bin_packing, first_fit_decreasing(items, 100),
+        items=items, bin_capacity=100, num_ants=10, num_iterations=10000)
+
+    universe = set(range(1, 201))
+    subsets = [{"set": set(rng.sample(range(1, 201), rng.randint(5, 15))), "cost": rng.randint(1, 10)}
+               for _ in range(150)]
+    run("set cover", ant_colony_optimization, greedy_set_cover(universe, subsets),
+        universe=universe, subsets=subsets, num_ants=10, num_iterations=10000, alpha=1, beta=2,
+        evaporation_rate=0.1)
+
+    items = [(rng.randint(10, 100), rng.randint(10, 100)) for _ in range(2000)]
+    capacity = sum(weight for weight, _ in items) // 4
+    run("knapsack", ant_colony_knapsack, round(0.995 * greedy_knapsack(items, capacity)), minimize=False,
+        items=items, capacity=capacity, num_ants=20, num_iterations=10000)
@@ -0,0 +1,53 @@
+# Checks the swap and reversal deltas of the sequencing objectives against evaluate() on
+# the neighbor built in full, over random orders of a fixed seed, every pair of positions
+# (i == j included) and every segment (empty and single-job reversals included).
+#
+#   cd Heuristic-Algorithms_Final-Project
+#   python -m benchmarks.scheduling_deltas
+import random
+
+from heuristics import CompletionTime, Makespan
+
+NUM_ORDERS = 5
+SIZES = [1, 2, 3, 10, 57]
+
+def swapped(order, i, j):
+    neighbor = order[:]
+    neighbor[i], neighbor[j] = neighbor[j], neighbor[i]
+    return neighbor
+
+def reversed_segment(order, i, j):
+    return order[:i] + order[i:j][::-1] + order[j:]
+
+def check(objective, order):
+    state = objective.prepare(order)
+    value = objective.evaluate(order)
+    mismatches = 0
+    for i in range(len(order) + 1):
+        for j in range(len(order) + 1):
+            if i < len(order) and j < len(order):
+                expected = objective.evaluate(swapped(order, i, j)) - value
+                mismatches += objective.swap_delta(order, state, i, j) != expected
+            if i <= j:
+                expected = objective.evaluate(reversed_segment(order, i, j)) - value
+                mismatches += objective.reverse_delta(order, state, i, j) != expected
+    return mismatches
+
+if __name__ == "__main__":
+    rng = random.Random(42)
+    failures = 0
+    for n in SIZES:
+        durations = [rng.randint(1, 100) for _ in range(n)]
+        weights = [rng.randint(1, 10) for _ in range(n)]
+        objectives = [CompletionTime(durations), CompletionTime(durations, weights)]
+        objectives += [Makespan(durations, machines) for machines in (1, 3, 7)]
+        for objective in objectives:
+            mismatches = 0
+            for _ in range(NUM_ORDERS):
+                order = list(range(n))
+                rng.shuffle(order)
+                mismatches += check(objective, order)
+            failures += mismatches
+            label = objective.name + (f" ({objective.machines} machines)" if isinstance(objective, Makespan) else "")
+            print(f"n={n:<3} {label:<40} {'ok' if mismatches == 0 else f'{mismatches} mismatches'}")
+    raise SystemExit(1 if failures else 0)
@@ -0,0 +1,62 @@
+# Solution quality and run time of the tabu solvers with the full neighborhood against
+# the candidate list modes, on random instances of a fixed seed.
+#
+#   cd Heuristic-Algorithms_Final-Project
+#   python -m benchmarks.tabu_candidate_lists
+import random
+import time
+
+from heuristics import bin_packing_tabu, job_scheduling_tabu, knapsack_tabu, set_cover_tabu
+
+NUM_ITERATIONS = 200
+TABU_SIZE = 20
+
+MODES = {
+    "full": {},
+    "sampled": {"candidate_size": 200},
+    "elite": {"candidate_size": 1000, "elite_size": 50, "refresh_every": 10},
+}
+
+def best_of(history_entry_score, maximize=False):
+    # Keeps the best score seen through the trace callback, without storing the history
+    best = {}
+
+    def callback(entry):
+        score = history_entry_score(entry)
+        if "score" not in best or (score > best["score"] if maximize else score < best["score"]):
+            best["score"] = score
+
+    return best, callback
+
+def run(name, solver, args, score, maximize=False, **kwargs):
+    for mode, options in MODES.items():
+        random.seed(0)
+        best, callback = best_of(score, maximize)
+        start = time.perf_counter()
+        solver(*args, NUM_ITERATIONS, TABU_SIZE, history_size=0, callback=callback, **options, **kwargs)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<16} {mode:<8} best={best['score']:<10} time={elapsed:8.3f}s "
+              f"({NUM_ITERATIONS / elapsed:9.1f} it/s)")
+
+if __name__ == "__main__":
+    rng = random.Random(42)
+
+    job_times = [rng.randint(1, 100) for _ in range(2000)]
+    run("job scheduling", job_scheduling_tabu, (job_times, 100), lambda entry: entry[2])
+
+    values = [rng.randint(10, 100) for _ in range(5000)]
+    weights = [rng.randint(10, 100) for _ in range(5000)]
+    capacity = sum(weights) // 2
+    knapsack_score = lambda entry: entry[2]["total_value"] if entry[2]["total_weight"] <= capacity else 0
+    run("knapsack", knapsack_tabu, (values, weights, capacity), knapsack_score, maximize=True)
+    run("knapsack numpy", knapsack_tabu, (values, weights, capacity), knapsack_score, maximize=True,
+        vectorized=True)
+
+    items = [rng.randint(5, 60) for _ in range(2000)]
+    run("bin packing", bin_packing_tabu, (items, 100), lambda entry: entry[2])
+
+    universe = set(range(5000))
+    subsets = [set(rng.sample(range(5000), rng.randint(2, 10))) for _ in range(1000)]
+    set_cover_score = lambda entry: len(entry[2]["uncovered_elements"])
+    run("set cover", set_cover_tabu, (universe, subsets), set_cover_score)
+    run("set cover numpy", set_cover_tabu, (universe, subsets), set_cover_score, vectorized=True)
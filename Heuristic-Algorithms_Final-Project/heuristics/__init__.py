@@ -0,0 +1,70 @@
+"""Tabu search, ant colony, artificial bee colony and artificial immune system solvers
+for job scheduling, knapsack, bin packing and set cover.
+
+Importing the package does no work: each solver family is imported the first time one
+of its names is accessed, so ``from heuristics import knapsack_tabu`` loads only the
+tabu module and never NumPy or any ant colony state.
+"""
+import importlib
+
+_SOLVERS = {
+    # Shared facilities
+    "StoppingCriteria": "stopping",
+    "WeightedSampler": "sampling",
+    "SetCoverInstance": "set_cover",
+    "FitnessCache": "cache",
+    "CompletionTime": "scheduling",
+    "Makespan": "scheduling",
+    "Telemetry": "telemetry",
+    "CallbackSink": "telemetry",
+    "JSONLSink": "telemetry",
+    "FileSink": "telemetry",
+    # Tabu search
+    "TabuMemory": "tabu",
+    "ReactiveTabuMemory": "tabu",
+    "TabuTrace": "tabu",
+    "CandidateList": "tabu",
+    "job_scheduling_tabu": "tabu",
+    "knapsack_tabu": "tabu",
+    "bin_packing_tabu": "tabu",
+    "set_cover_tabu": "tabu",
+    # Ant colony optimization
+    "MaxMinAntSystem": "ant_colony",
+    "JobSchedulingColony": "ant_colony",
+    "ant_colony_job_scheduling": "ant_colony",
+    "MatrixJobSchedulingColony": "ant_colony",
+    "ant_colony_job_scheduling_batched": "ant_colony",
+    "processing_time_matrix": "ant_colony",
+    "spawn_seeds": "ant_colony",
+    "run_colonies": "ant_colony",
+    "BinPackingAnt": "ant_colony",
+    "ant_colony_bin_packing": "ant_colony",
+    "ant_colony_optimization": "ant_colony",
+    "KnapsackAnt": "ant_colony",
+    "ant_colony_knapsack": "ant_colony",
+    # Artificial bee colony
+    "BinPackingABC": "bee_colony",
+    "SetCoverABC": "bee_colony",
+    "KnapsackABC": "bee_colony",
+    "JobSchedulingABC": "bee_colony",
+    # Artificial immune system
+    "Antibody": "immune_system",
+    "BinPackingAIS": "immune_system",
+    "SetCoverAIS": "immune_system",
+    "KnapsackAIS": "immune_system",
+    "JobSchedulingAIS": "immune_system",
+}
+
+__all__ = list(_SOLVERS)
+
+
+def __getattr__(name):
+    if name not in _SOLVERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_SOLVERS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,783 @@
+import numpy as np
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from .sampling import WeightedSampler
+from .set_cover import SetCoverInstance
+from .telemetry import DISABLED
+
+# MAX-MIN Karınca Sistemi (Stützle ve Hoos) güncelleme kuralı; her ACO çözücüsüne mmas
+# argümanıyla verilir, verilmezse eskisi gibi tüm karıncalar feromon bırakır. Yalnızca bir
+# karınca, iterasyonun en iyisi ya da şimdiye kadarki en iyi, feromon bırakır ve feromon
+# [tau_min, tau_max] aralığında tutulur: tau_max = en iyi katkı / buharlaşma oranı,
+# tau_min = tau_max / (2 * size), size çözüm bileşenlerinin sayısıdır. reinit_after
+# iterasyon boyunca yeni bir en iyi çözüm bulunmazsa feromon tau_max'a sıfırlanır.
+class MaxMinAntSystem:
+    def __init__(self, deposit="iteration", reinit_after=50):
+        if deposit not in ("iteration", "global"):
+            raise ValueError(f"unknown deposit {deposit!r}, expected 'iteration' or 'global'")
+        self.deposit = deposit
+        self.reinit_after = reinit_after
+
+    def depositor(self, iteration_best, global_best):
+        return iteration_best if self.deposit == "iteration" else global_best
+
+    def bounds(self, best_deposit, evaporation_rate, size):
+        tau_max = best_deposit / evaporation_rate
+        return tau_max / (2 * size), tau_max
+
+    def reinitialize(self, stagnation):
+        return self.reinit_after is not None and stagnation >= self.reinit_after
+
+#jobscheduling
+
+# Karınca kolonisi: feromon tablosu, parametreler ve rastgele sayı üreteci nesnenin
+# içindedir, böylece aynı süreçte birden fazla koloni birbirini etkilemeden çalışır.
+# processing_time (iş, makine) anahtarlı bir sözlüktür.
+class JobSchedulingColony:
+    def __init__(self, jobs, machines, processing_time, num_ants=20, alpha=1, beta=2, rho=0.5, Q=100, seed=None,
+                 mmas=None):
+        self.jobs = jobs
+        self.machines = machines
+        self.processing_time = processing_time
+        self.num_ants = num_ants
+        self.alpha = alpha
+        self.beta = beta
+        self.rho = rho
+        self.Q = Q
+        self.mmas = mmas
+        self.random = random.Random(seed)
+
+        # Feromon matrisini başlat
+        self.pheromones = {(j, m): 1 for j in jobs for m in machines}
+
+        # Sezgisel bilgi (eta) matrisini hesapla
+        self.eta = {(j, m): 1 / processing_time[(j, m)] for j in jobs for m in machines}
+
+        self.best_solution = None
+        self.best_makespan = float('inf')
+        self.stagnation = 0
+        self.iteration = 0
+
+    # Seçim ağırlıkları: tau^alpha ve tau^alpha * eta^beta tabloları iterasyon başına bir kez
+    def choice_weights(self):
+        tau_alpha = {key: value**self.alpha for key, value in self.pheromones.items()}
+        weights = {key: tau_alpha[key] * self.eta[key]**self.beta for key in tau_alpha}
+        return tau_alpha, weights
+
+    # İşleri çizelgeleme fonksiyonu
+    def schedule_jobs(self, tau_alpha=None, weights=None):
+        if weights is None:
+            tau_alpha, weights = self.choice_weights()
+        job_sampler = WeightedSampler([sum(weights[(j, m)] for m in self.machines) for j in self.jobs])
+        solutions = []
+        for _ in range(self.num_ants):
+            solution = []
+            loads = {m: 0 for m in self.machines}
+            available_jobs = job_sampler.copy()
+            for _ in range(len(self.jobs)):
+                # Seçilen işin ağırlığı sıfırlanır, böylece tekrar seçilemez
+                index = available_jobs.sample(self.random)
+                available_jobs.update(index, 0)
+                selected_job = self.jobs[index]
+
+                # Makine seçimi: feromon ve işin o makinede biteceği zamana göre (dinamik sezgisel)
+                machine_weights = [
+                    tau_alpha[(selected_job, m)] * (1 / (loads[m] + self.processing_time[(selected_job, m)]))**self.beta
+                    for m in self.machines
+                ]
+                selected_machine = self.random.choices(self.machines, machine_weights)[0]
+                loads[selected_machine] += self.processing_time[(selected_job, selected_machine)]
+                solution.append((selected_job, selected_machine))
+
+            solutions.append(solution)
+        return solutions
+
+    # Çözümün toplam tamamlama süresini hesapla
+    def calculate_makespan(self, solution):
+        machine_times = {m: 0 for m in self.machines}
+        for job, machine in solution:
+            machine_times[machine] += self.processing_time[(job, machine)]
+        return max(machine_times.values())
+
+    # Feromon güncelleme fonksiyonu
+    def update_pheromones(self, solutions, makespans=None, bounds=None):
+        if makespans is None:
+            makespans = [self.calculate_makespan(solution) for solution in solutions]
+        # Feromon buharlaşması
+        self.pheromones = {key: (1 - self.rho) * value for key, value in self.pheromones.items()}
+
+        # Feromon ekleme
+        for solution, makespan in zip(solutions, makespans):
+            for job, machine in solution:
+                self.pheromones[(job, machine)] += self.Q / makespan
+
+        # MMAS: feromon [tau_min, tau_max] aralığında tutulur
+        if bounds is not None:
+            tau_min, tau_max = bounds
+            self.pheromones = {key: min(max(value, tau_min), tau_max) for key, value in self.pheromones.items()}
+
+    # Feromonu yeniden başlat (MMAS durgunlukta)
+    def reset_pheromones(self, value):
+        self.pheromones = {key: value for key in self.pheromones}
+
+    # Bir ACO iterasyonu; kullanılan değerlendirme sayısını döndürür
+    def step(self):
+        tau_alpha, weights = self.choice_weights()
+        solutions = self.schedule_jobs(tau_alpha, weights)
+        self.iteration += 1
+
+        # Her çözümün makespan'i bir kez hesaplanır
+        makespans = [self.calculate_makespan(solution) for solution in solutions]
+        self.stagnation += 1
+        for solution, makespan in zip(solutions, makespans):
+            if makespan < self.best_makespan:
+                self.best_makespan = makespan
+                self.best_solution = solution
+                self.stagnation = 0
+
+        if self.mmas is None:
+            self.update_pheromones(solutions, makespans)
+        else:
+            ant = min(range(len(solutions)), key=makespans.__getitem__)
+            solution, makespan = self.mmas.depositor((solutions[ant], makespans[ant]),
+                                                     (self.best_solution, self.best_makespan))
+            bounds = self.mmas.bounds(self.Q / self.best_makespan, self.rho, len(self.jobs))
+            if self.mmas.reinitialize(self.stagnation):
+                self.reset_pheromones(bounds[1])
+                self.stagnation = 0
+            else:
+                self.update_pheromones([solution], [makespan], bounds)
+        return len(solutions)
+
+    # Başka bir koloninin en iyi çözümünü al: daha iyiyse en iyi çözüm olur ve feromon bırakır
+    def receive(self, solution, makespan):
+        if makespan < self.best_makespan:
+            self.best_solution = solution
+            self.best_makespan = makespan
+            self.stagnation = 0
+        for job, machine in solution:
+            self.pheromones[(job, machine)] += self.Q / makespan
+
+    @staticmethod
+    def mean_pheromone(colonies):
+        return {key: sum(colony.pheromones[key] for colony in colonies) / len(colonies)
+                for key in colonies[0].pheromones}
+
+    def blend(self, pheromones):
+        self.pheromones = dict(pheromones)
+
+    @property
+    def best(self):
+        return self.best_solution, self.best_makespan
+
+# Ana ACO döngüsü
+def ant_colony_job_scheduling(jobs, machines, processing_time, num_ants=20, num_iterations=300, alpha=1, beta=2,
+                              rho=0.5, Q=100, seed=None, stopping=None, mmas=None, telemetry=None):
+    colony = JobSchedulingColony(jobs, machines, processing_time, num_ants, alpha, beta, rho, Q, seed, mmas)
+    telemetry = DISABLED if telemetry is None else telemetry
+    telemetry.start("ant_colony_job_scheduling")
+    run = None if stopping is None else stopping.start(minimize=True)
+
+    for iteration in range(num_iterations):
+        evaluations = colony.step()
+        if telemetry.active:
+            telemetry.iteration(iteration + 1, colony.best_makespan, evaluations=evaluations)
+
+        if run is not None and run.update(colony.best_makespan, evaluations):
+            break
+
+    telemetry.end(colony.best_makespan)
+    return colony.best
+
+# Yukarıdaki sözlük tabloları, jobs ve machines sırasıyla (iş x makine) dizisi olarak
+def processing_time_matrix(processing_time, jobs, machines):
+    return np.array([[processing_time[(j, m)] for m in machines] for j in jobs], dtype=float)
+
+# İlişkisiz paralel makineler için matris ACO: feromon ve sezgisel bilgi (iş x makine)
+# dizileridir ve her karınca tüm işlerin makinelerini tek bir toplu çekimle seçer. Her işin
+# tau^alpha * eta^beta satırı iterasyon başına bir kez kümülatif toplama çevrilir; karıncanın
+# makinesi, kümülatif ağırlığı satır toplamıyla ölçeklenmiş düzgün çekimini aşan ilk
+# sütundur. best, en iyi atama (iş başına makine indeksi) ve onun makespan'idir.
+class MatrixJobSchedulingColony:
+    def __init__(self, processing_times, num_ants=20, alpha=1, beta=2, rho=0.5, Q=100, seed=None, mmas=None):
+        self.processing_times = np.asarray(processing_times, dtype=float)
+        self.num_jobs, self.num_machines = self.processing_times.shape
+        self.num_ants = num_ants
+        self.alpha = alpha
+        self.rho = rho
+        self.Q = Q
+        self.mmas = mmas
+        self.rng = np.random.default_rng(seed)
+        self.pheromone = np.ones((self.num_jobs, self.num_machines))
+        self.eta_beta = (1 / self.processing_times) ** beta
+        self.job_index = np.arange(self.num_jobs)
+        self.ant_offsets = np.arange(num_ants)[:, None] * self.num_machines
+        self.cell_offsets = self.job_index * self.num_machines
+
+        self.best_assignment = None
+        self.best_makespan = float('inf')
+        self.stagnation = 0
+        self.iteration = 0
+
+    def step(self):
+        num_jobs, num_machines, num_ants = self.num_jobs, self.num_machines, self.num_ants
+        pheromone = self.pheromone
+        cumulative = np.cumsum(pheromone ** self.alpha * self.eta_beta, axis=1)
+        draws = self.rng.random((num_ants, num_jobs)) * cumulative[:, -1]
+        assignments = (cumulative <= draws[:, :, None]).sum(axis=2)
+        np.minimum(assignments, num_machines - 1, out=assignments)
+        self.iteration += 1
+
+        # Tüm karıncaların makine yükleri tek seferde; (karınca, makine) tek indekse düzleştirilir
+        times = self.processing_times[self.job_index, assignments]
+        loads = np.bincount((self.ant_offsets + assignments).ravel(), weights=times.ravel(),
+                            minlength=num_ants * num_machines).reshape(num_ants, num_machines)
+        makespans = loads.max(axis=1)
+
+        ant = makespans.argmin()
+        self.stagnation += 1
+        if makespans[ant] < self.best_makespan:
+            self.best_makespan = makespans[ant].item()
+            self.best_assignment = assignments[ant].copy()
+            self.stagnation = 0
+
+        if self.mmas is None:
+            pheromone *= 1 - self.rho
+            pheromone += np.bincount((self.cell_offsets + assignments).ravel(),
+                                     weights=np.repeat(self.Q / makespans, num_jobs),
+                                     minlength=num_jobs * num_machines).reshape(num_jobs, num_machines)
+        else:
+            tau_min, tau_max = self.mmas.bounds(self.Q / self.best_makespan, self.rho, num_jobs)
+            if self.mmas.reinitialize(self.stagnation):
+                pheromone.fill(tau_max)
+                self.stagnation = 0
+            else:
+                assignment, makespan = self.mmas.depositor((assignments[ant], makespans[ant]),
+                                                           (self.best_assignment, self.best_makespan))
+                pheromone *= 1 - self.rho
+                pheromone[self.job_index, assignment] += self.Q / makespan
+                np.clip(pheromone, tau_min, tau_max, out=pheromone)
+        return num_ants
+
+    def receive(self, assignment, makespan):
+        if makespan < self.best_makespan:
+            self.best_assignment = assignment.copy()
+            self.best_makespan = makespan
+            self.stagnation = 0
+        self.pheromone[self.job_index, assignment] += self.Q / makespan
+
+    @staticmethod
+    def mean_pheromone(colonies):
+        return np.mean([colony.pheromone for colony in colonies], axis=0)
+
+    def blend(self, pheromone):
+        self.pheromone = pheromone.copy()
+
+    @property
+    def best(self):
+        return self.best_assignment, self.best_makespan
+
+def ant_colony_job_scheduling_batched(processing_times, num_ants=20, num_iterations=300, alpha=1, beta=2, rho=0.5,
+                                      Q=100, seed=None, stopping=None, mmas=None, telemetry=None):
+    colony = MatrixJobSchedulingColony(processing_times, num_ants, alpha, beta, rho, Q, seed, mmas)
+    telemetry = DISABLED if telemetry is None else telemetry
+    telemetry.start("ant_colony_job_scheduling_batched")
+    run = None if stopping is None else stopping.start(minimize=True)
+
+    for iteration in range(num_iterations):
+        evaluations = colony.step()
+        if telemetry.active:
+            telemetry.iteration(iteration + 1, colony.best_makespan, evaluations=evaluations)
+
+        if run is not None and run.update(colony.best_makespan, evaluations):
+            break
+
+    telemetry.end(colony.best_makespan)
+    return colony.best
+
+# Çok kolonili bir çalıştırmanın kolonileri için tek bir tohumdan türetilen bağımsız tohumlar
+def spawn_seeds(seed, count):
+    return [child.generate_state(1)[0].item() for child in np.random.SeedSequence(seed).spawn(count)]
+
+def advance_colony(colony, iterations):
+    evaluations = sum(colony.step() for _ in range(iterations))
+    return colony, evaluations
+
+# Birden fazla koloniyi (en küçükleyen, yukarıdaki step/receive/blend/best yöntemleriyle)
+# bir süreç havuzunda çalıştırır. Her exchange_every iterasyonda koloniler bu sürece döner
+# ve ya hepsi içlerinden birinin bulduğu en iyi çözümü alır (exchange="best") ya da hepsi
+# ortalama feromonlarından devam eder (exchange="pheromone"). Tüm kolonilerin en iyi
+# çözümünü, skorunu ve kolonilerin kendilerini döndürür.
+def run_colonies(colonies, num_iterations, exchange_every=10, exchange="best", processes=None, stopping=None,
+                 telemetry=None):
+    if exchange not in ("best", "pheromone"):
+        raise ValueError(f"unknown exchange {exchange!r}, expected 'best' or 'pheromone'")
+    telemetry = DISABLED if telemetry is None else telemetry
+    telemetry.start("run_colonies", colonies=len(colonies), exchange=exchange)
+    run = None if stopping is None else stopping.start(minimize=True)
+    done = 0
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        while done < num_iterations:
+            iterations = min(exchange_every, num_iterations - done)
+            results = list(pool.map(advance_colony, colonies, [iterations] * len(colonies)))
+            colonies = [colony for colony, _ in results]
+            done += iterations
+
+            best_solution, best_score = min((colony.best for colony in colonies), key=lambda best: best[1])
+            if exchange == "best":
+                for colony in colonies:
+                    colony.receive(best_solution, best_score)
+            else:
+                pheromone = type(colonies[0]).mean_pheromone(colonies)
+                for colony in colonies:
+                    colony.blend(pheromone)
+
+            if telemetry.active:
+                telemetry.iteration(done, best_score, colony_best=[colony.best[1] for colony in colonies])
+
+            if run is not None and run.update(best_score, sum(evaluations for _, evaluations in results)):
+                break
+
+    best_solution, best_score = min((colony.best for colony in colonies), key=lambda best: best[1])
+    telemetry.end(best_score)
+    return best_solution, best_score, colonies
+
+
+
+#binpacking
+
+# Levine ve Ducatelle tarzı kutulama karıncası. pheromone[i, j], i ve j nesnelerinin aynı
+# kutuya konmasının ne kadar iyi olduğunu tutar. Karınca kutuları tek tek doldurur: açık
+# kutuya sığan nesneler arasından, kutudaki nesnelerle ortalama feromonu^alpha * boyutu^beta
+# ile orantılı olarak seçer. Nesneler boyuta göre sıralı tutulur; sığanlar bisect ile
+# bulunan önek, kalanlar ise bir bitmap, kutu yükleri de bir dizidir.
+class BinPackingAnt:
+    def __init__(self, capacity, items, pheromone=None, alpha=1, beta=2):
+        self.capacity = capacity
+        self.items = items
+        self.pheromone = pheromone
+        self.alpha = alpha
+        self.beta = beta
+        self.solution = []
+        self.bins = []
+        self.loads = None
+        self.total_bins_used = 0
+
+    def construct_solution(self):
+        sizes = np.asarray(self.items, dtype=float)
+        order = np.argsort(sizes, kind="stable")
+        sorted_sizes = sizes[order]
+        remaining = np.ones(len(sizes), dtype=bool)
+        loads = np.zeros(len(sizes))
+        bins = []
+        left = len(sizes)
+
+        while left:
+            members = []
+            affinity = None
+            while True:
+                # Kutuya sığan ve henüz yerleştirilmemiş nesneler
+                end = np.searchsorted(sorted_sizes, self.capacity - loads[len(bins)], side="right")
+                positions = np.flatnonzero(remaining[:end])
+                if positions.size == 0:
+                    break
+                candidates = order[positions]
+                weights = sorted_sizes[positions] ** self.beta
+                if affinity is not None:
+                    weights = weights * (affinity[candidates] / len(members)) ** self.alpha
+                cumulative = np.cumsum(weights)
+                pick = min(np.searchsorted(cumulative, random.random() * cumulative[-1], side="right"),
+                           positions.size - 1)
+
+                item = candidates[pick].item()
+                remaining[positions[pick]] = False
+                left -= 1
+                loads[len(bins)] += sizes[item]
+                members.append(item)
+                if self.pheromone is not None:
+                    affinity = self.pheromone[item].copy() if affinity is None else affinity + self.pheromone[item]
+
+            bins.append(members)
+
+        self.bins = bins
+        self.loads = loads[:len(bins)]
+        self.solution = [[self.items[i] for i in members] for members in bins]
+        self.total_bins_used = len(bins)
+
+    def fitness(self, k=2):
+        # Falkenauer uygunluğu: dolu kutuları az sayıda boş kutuya tercih eder
+        return float(np.mean((self.loads / self.capacity) ** k))
+
+def ant_colony_bin_packing(items, bin_capacity, num_ants, num_iterations, alpha=1, beta=2, evaporation_rate=0.1,
+                           stopping=None, mmas=None, telemetry=None):
+    if any(item > bin_capacity for item in items):
+        raise ValueError("every item must fit in an empty bin")
+    telemetry = DISABLED if telemetry is None else telemetry
+    telemetry.start("ant_colony_bin_packing")
+    pheromone = np.ones((len(items), len(items)))
+    best_ant = None
+    best_solution = None
+    best_bins_used = float('inf')
+    stagnation = 0
+    run = None if stopping is None else stopping.start(minimize=True)
+
+    for iteration in range(num_iterations):
+        ants = [BinPackingAnt(bin_capacity, items, pheromone, alpha, beta) for _ in range(num_ants)]
+        solutions = []
+
+        for ant in ants:
+            ant.construct_solution()
+            solutions.append(ant)
+
+        # En iyi çözümü bul
+        stagnation += 1
+        for ant in solutions:
+            if ant.total_bins_used < best_bins_used:
+                best_ant = ant
+                best_solution = ant.solution
+                best_bins_used = ant.total_bins_used
+                stagnation = 0
+
+        # Feromon: buharlaşma ve iterasyonun en iyi karıncasının kutulardaki nesne çiftlerine eklemesi
+        depositor = max(solutions, key=lambda ant: ant.fitness())
+        if mmas is not None:
+            depositor = mmas.depositor(depositor, best_ant)
+            tau_min, tau_max = mmas.bounds(best_ant.fitness(), evaporation_rate, len(items))
+        if mmas is not None and mmas.reinitialize(stagnation):
+            pheromone.fill(tau_max)
+            stagnation = 0
+        else:
+            fitness = depositor.fitness()
+            pheromone *= 1 - evaporation_rate
+            for members in depositor.bins:
+                pheromone[np.ix_(members, members)] += fitness
+            if mmas is not None:
+                np.clip(pheromone, tau_min, tau_max, out=pheromone)
+
+        if telemetry.active:
+            telemetry.iteration(iteration + 1, best_bins_used, evaluations=num_ants, stagnation=stagnation)
+
+        if run is not None and run.update(best_bins_used, num_ants):
+            break
+
+    telemetry.end(best_bins_used)
+    return best_solution, best_bins_used
+
+
+
+#setcover
+
+# ACO Algoritması
+def ant_colony_optimization(universe, subsets, num_ants, num_iterations, alpha, beta, evaporation_rate,
+                            initial_pheromone=1.0, stopping=None, mmas=None, telemetry=None):
+    # Alt kümeler tamsayı kimlikleriyle temsil edilir. SetCoverInstance her alt kümenin
+    # kapsadığı elemanları (CSR) ve her elemanı kapsayan alt kümeleri (ters indeks) tutar.
+    # Karıncanın kapsanmamış elemanları bir bool dizisidir; bir seçim yalnızca seçilen alt
+    # kümenin satırına ve yeni kapsanan elemanları içeren alt kümelere dokunur
+    instance = SetCoverInstance.from_subsets(universe, subsets)
+    if not instance.coverable():
+        raise ValueError("the subsets do not cover the universe")
+    costs = instance.costs
+    initial_gains = np.diff(instance.offsets).tolist()
+    telemetry = DISABLED if telemetry is None else telemetry
+    telemetry.start("ant_colony_optimization")
+
+    # Feromon başlatma
+    pheromone = [initial_pheromone] * len(subsets)
+
+    best_solution = None
+    best_cost = float("inf")
+    stagnation = 0
+    run = None if stopping is None else stopping.start(minimize=True)
+
+    for iteration in range(num_iterations):
+        all_solutions = []
+        tau_alpha = [p ** alpha for p in pheromone]
+        weight = lambda i, gain: tau_alpha[i] * (gain / costs[i]) ** beta
+        initial_weights = WeightedSampler([weight(i, gain) for i, gain in enumerate(initial_gains)])
+
+        stagnation += 1
+        for ant in range(num_ants):
+            current_solution = []
+            uncovered = np.ones(instance.num_elements, dtype=bool)
+            remaining = instance.num_elements
+            # gains[i]: i alt kümesinin henüz kapsanmamış eleman sayısı (marjinal kazanç)
+            gains = initial_gains.copy()
+            # Seçim ağırlıkları, sezgisellik: marjinal kazanç / maliyet
+            probabilities = initial_weights.copy()
+
+            while remaining:
+                # Alt küme seçimi; seçilen alt kümenin kazancı sıfıra iner, tekrar seçilemez
+                chosen_index = probabilities.sample()
+                current_solution.append(chosen_index)
+
+                # Yalnızca yeni kapsanan elemanlara dokunan alt kümelerin kazancı ve ağırlığı güncellenir
+                elements = instance.subset(chosen_index)
+                newly_covered = elements[uncovered[elements]]
+                uncovered[newly_covered] = False
+                remaining -= len(newly_covered)
+                touched, counts = instance.covering_counts(newly_covered)
+                for i, count in zip(touched.tolist(), counts.tolist()):
+                    gains[i] -= count
+                    probabilities.update(i, weight(i, gains[i]))
+
+            # En iyi çözümü güncelle
+            current_cost = sum(costs[i] for i in current_solution)
+            all_solutions.append((current_solution, current_cost))
+            if current_cost < best_cost:
+                best_solution = current_solution
+                best_cost = current_cost
+                stagnation = 0
+
+        # MMAS: yalnızca bir karınca ekler, feromon sınırlanır ve durgunlukta yeniden başlatılır
+        depositors = all_solutions
+        if mmas is not None:
+            depositors = [mmas.depositor(min(all_solutions, key=lambda s: s[1]), (best_solution, best_cost))]
+            tau_min, tau_max = mmas.bounds(1 / best_cost, evaporation_rate, len(subsets))
+
+        if mmas is not None and mmas.reinitialize(stagnation):
+            pheromone = [tau_max] * len(subsets)
+            stagnation = 0
+        else:
+            # Feromon buharlaşması
+            pheromone = [p * (1 - evaporation_rate) for p in pheromone]
+
+            # Feromon güncellemesi
+            for solution, solution_cost in depositors:
+                for index in solution:
+                    pheromone[index] += 1 / solution_cost
+
+            if mmas is not None:
+                pheromone = [min(max(p, tau_min), tau_max) for p in pheromone]
+
+        if telemetry.active:
+            telemetry.iteration(iteration + 1, best_cost, evaluations=num_ants, stagnation=stagnation)
+
+        if run is not None and run.update(best_cost, num_ants):
+            break
+
+    telemetry.end(best_cost)
+    return [subsets[i] for i in best_solution], best_cost
+
+
+
+#knapsack
+
+# Tüm karıncaların çözümlerini tek seferde kurar. Her karınca nesneleri çekilme olasılığı
+# feromon^alpha * (değer/ağırlık)^beta ile orantılı olacak şekilde yerine koymadan çeker
+# ve artık sığmayanları atlar. Yerine koymadan ağırlıklı çekim, her nesneye Exp(1) / ağırlık
+# anahtarı verip anahtara göre sıralamaya denktir (Efraimidis-Spirakis). Bir nesne bir kez
+# sığmazsa kalan kapasite yalnızca azaldığı için bir daha sığmaz; bu yüzden sıradaki
+# nesneleri sırayla denemek, her adımda sığanlar arasından çekmekle aynı dağılımı verir.
+def construct_knapsack_solutions(weights, values, capacity, attractiveness, num_ants, rng):
+    keys = rng.exponential(size=(num_ants, len(weights))) / attractiveness
+    orders = np.argsort(keys, axis=1)
+    ants = np.arange(num_ants)
+    selected = np.zeros((num_ants, len(weights)), dtype=bool)
+    residual = np.full(num_ants, float(capacity))
+    min_weight = weights.min()
+    for position in range(len(weights)):
+        items = orders[:, position]
+        fits = weights[items] <= residual
+        selected[ants, items] = fits
+        residual -= np.where(fits, weights[items], 0)
+        if (residual < min_weight).all():
+            break
+    return selected, selected @ values, capacity - residual
+
+def knapsack_attractiveness(items, pheromone=None, alpha=1, beta=2):
+    weights = np.array([item[0] for item in items], dtype=float)
+    values = np.array([item[1] for item in items])
+    attractiveness = (values / weights) ** beta
+    if pheromone is not None:
+        attractiveness = attractiveness * pheromone ** alpha
+    return weights, values, attractiveness
+
+class KnapsackAnt:
+    def __init__(self, capacity, items, pheromone=None, alpha=1, beta=2, rng=None):
+        self.capacity = capacity
+        self.items = items
+        self.pheromone = pheromone
+        self.alpha = alpha
+        self.beta = beta
+        self.rng = np.random.default_rng() if rng is None else rng
+        self.selected_items = []
+        self.total_value = 0
+        self.total_weight = 0
+
+    def construct_solution(self):
+        weights, values, attractiveness = knapsack_attractiveness(self.items, self.pheromone, self.alpha, self.beta)
+        selected, total_values, total_weights = construct_knapsack_solutions(
+            weights, values, self.capacity, attractiveness, 1, self.rng
+        )
+        self.selected_items = [self.items[i] for i in np.flatnonzero(selected[0])]
+        self.total_value = total_values[0].item()
+        self.total_weight = total_weights[0].item()
+
+def ant_colony_knapsack(items, capacity, num_ants, num_iterations, alpha=1, beta=2, evaporation_rate=0.1,
+                        seed=None, stopping=None, mmas=None, telemetry=None):
+    telemetry = DISABLED if telemetry is None else telemetry
+    telemetry.start("ant_colony_knapsack")
+    rng = np.random.default_rng(seed)
+    pheromone = np.ones(len(items))
+    weights, values, heuristic = knapsack_attractiveness(items, alpha=alpha, beta=beta)
+    best_selected = None
+    best_solution = None
+    best_value = 0
+    stagnation = 0
+    run = None if stopping is None else stopping.start(minimize=False)
+
+    for iteration in range(num_iterations):
+        # Tüm karıncalar tek bir NumPy işlemiyle kurulur
+        selected, total_values, total_weights = construct_knapsack_solutions(
+            weights, values, capacity, pheromone ** alpha * heuristic, num_ants, rng
+        )
+
+        # En iyi çözümü bul
+        ant = total_values.argmax()
+        stagnation += 1
+        if total_values[ant] > best_value:
+            best_selected = selected[ant].copy()
+            best_solution = [items[i] for i in np.flatnonzero(best_selected)]
+            best_value = total_values[ant].item()
+            stagnation = 0
+
+        # Feromon: buharlaşma ve her karıncanın, değerinin en iyi değere oranı kadar eklemesi
+        if mmas is None:
+            pheromone *= 1 - evaporation_rate
+            if best_value > 0:
+                pheromone += (total_values / best_value) @ selected
+        elif best_value > 0:
+            # MMAS: en iyi çözüm 1 ekler, bu yüzden tau_max = 1 / buharlaşma oranı
+            tau_min, tau_max = mmas.bounds(1, evaporation_rate, len(items))
+            if mmas.reinitialize(stagnation):
+                pheromone.fill(tau_max)
+                stagnation = 0
+            else:
+                mask, value = mmas.depositor((selected[ant], total_values[ant]), (best_selected, best_value))
+                pheromone *= 1 - evaporation_rate
+                pheromone[mask] += value / best_value
+                np.clip(pheromone, tau_min, tau_max, out=pheromone)
+
+        if telemetry.active:
+            telemetry.iteration(iteration + 1, best_value, evaluations=num_ants, stagnation=stagnation)
+
+        if run is not None and run.update(best_value, num_ants):
+            break
+
+    telemetry.end(best_value)
+    return best_solution, best_value
+
+
+if __name__ == "__main__":
+    from .telemetry import Telemetry
+
+    # Her 50 iterasyonda bir ilerleme satırı
+    progress = Telemetry(progress_every=50)
+
+    print("************************************jobscheduling***************************************")
+
+    # Problem verileri
+    jobs = [1, 2, 3]  # İşler
+    machines = [1, 2]  # Makineler
+    processing_time = {
+        (1, 1): 3, (1, 2): 2,  # İş 1'in işlem süreleri
+        (2, 1): 2, (2, 2): 4,  # İş 2'nin işlem süreleri
+        (3, 1): 4, (3, 2): 3   # İş 3'ün işlem süreleri
+    }
+
+    # ACO parametreleri
+    alpha = 1       # Feromon etkisi
+    beta = 2        # Sezgisel bilginin etkisi
+    rho = 0.5       # Buharlaşma oranı
+    num_ants = 20   # Karınca sayısı
+    num_iterations = 300  # Iterasyon sayısı
+    Q = 100         # Feromon güncelleme sabiti
+
+    best_solution, best_makespan = ant_colony_job_scheduling(
+        jobs, machines, processing_time, num_ants, num_iterations, alpha, beta, rho, Q, telemetry=progress
+    )
+
+    # Sonuçlar
+    print("En iyi çözüm:", best_solution)
+    print("Toplam tamamlama süresi (makespan):", best_makespan)
+
+    best_assignment, best_makespan = ant_colony_job_scheduling_batched(
+        processing_time_matrix(processing_time, jobs, machines), num_ants, num_iterations, alpha, beta, rho, Q
+    )
+    print("Matris ACO en iyi atama:", [(j, machines[m]) for j, m in zip(jobs, best_assignment)])
+    print("Matris ACO makespan:", best_makespan)
+
+    # Bağımsız rastgele sayı akışlarıyla dört koloni, her 10 iterasyonda en iyi çözümü paylaşır
+    colonies = [JobSchedulingColony(jobs, machines, processing_time, num_ants, alpha, beta, rho, Q, seed)
+                for seed in spawn_seeds(0, 4)]
+    best_solution, best_makespan, _ = run_colonies(colonies, num_iterations, exchange_every=10)
+    print("Çoklu koloni en iyi çözüm:", best_solution, "makespan:", best_makespan)
+
+    print("************************************binpacking***************************************")
+
+    # Örnek veri
+    items = [5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55, 60]
+    bin_capacity = 100
+    num_ants = 20
+    num_iterations = 300
+
+    best_solution, best_bins_used = ant_colony_bin_packing(items, bin_capacity, num_ants, num_iterations, telemetry=progress)
+
+    print(f"\nFinal Best Solution: {best_solution}")
+    print(f"Final Best Bins Used: {best_bins_used}")
+
+    print("************************************setcover***************************************")
+
+    universe = {1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15}
+    subsets = [
+        {"set": {1, 2, 3}, "cost": 3},
+        {"set": {2, 3, 4}, "cost": 2},
+        {"set": {4, 5, 6}, "cost": 4},
+        {"set": {6, 7, 8}, "cost": 3},
+        {"set": {8, 9, 10}, "cost": 5},
+        {"set": {10, 11, 12}, "cost": 4},
+        {"set": {13, 14, 15}, "cost": 2},
+    ]
+
+    # ACO Parametreleri
+    num_ants = 20
+    num_iterations = 300
+    alpha = 1  # Feromonun etkisi
+    beta = 2   # Sezgiselliğin etkisi
+    evaporation_rate = 0.5
+    initial_pheromone = 1.0
+
+    # ACO'yu çalıştır
+    best_solution, best_cost = ant_colony_optimization(
+        universe, subsets, num_ants, num_iterations, alpha, beta, evaporation_rate, initial_pheromone,
+        telemetry=progress
+    )
+
+    # Sonuçları yazdır
+    print("\nEn iyi çözüm:")
+    for subset in best_solution:
+        print(f"Alt Küme: {subset['set']}, Maliyet: {subset['cost']}")
+
+    print(f"Toplam Maliyet: {best_cost}")
+
+    print("************************************knapsack***************************************")
+
+    # Örnek veri: (Ağırlık, Değer)
+    items = [
+            (10, 60), (22, 100), (31, 120), (15, 150), (26, 200), (85, 250), (3, 300), (54, 350),
+            (40, 120), (70, 180), (55, 140), (45, 200), (65, 210), (30, 170), (80, 280), (60, 220),
+            (5, 90), (35, 150), (50, 180), (75, 260), (20, 110), (90, 310), (95, 320), (12, 130),
+            (72, 230), (100, 350), (55, 190), (68, 270), (85, 300), (42, 150), (88, 260), (92, 310),
+            (25, 140), (47, 170), (67, 240), (85, 290), (93, 330), (60, 200), (43, 160), (99, 370),
+            (29, 130), (95, 310), (77, 280), (62, 250), (49, 180), (60, 170), (73, 290), (80, 320)
+        ]
+    capacity = 510
+    num_ants = 20
+    num_iterations = 300
+
+    best_solution, best_value = ant_colony_knapsack(items, capacity, num_ants, num_iterations, telemetry=progress)
+
+    print(f"\nFinal Best Solution: {best_solution}")
+    print(f"Final Best Value: {best_value}")
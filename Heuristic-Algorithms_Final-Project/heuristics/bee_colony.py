@@ -1,15 +1,28 @@
 import random
-from typing import List, Tuple, Any, Set
+from typing import List, Tuple, Any, Set, Optional
+
+from .cache import FitnessCache, subset_key
+from .sampling import WeightedSampler
+from .scheduling import CompletionTime
+from .stopping import StoppingCriteria
+from .telemetry import DISABLED, Telemetry
+
+def _phase_stats(scores: List[float], minimize: bool = True):
+    return {"best": min(scores) if minimize else max(scores), "mean": sum(scores) / len(scores)}
 
 class BinPackingABC:
-    def __init__(self, items: List[int], bin_capacity: int, num_bees: int, max_iterations: int):
+    def __init__(self, items: List[int], bin_capacity: int, num_bees: int, max_iterations: int,
+                 stopping: Optional[StoppingCriteria] = None, telemetry: Optional[Telemetry] = None,
+                 verbose: bool = False):
         self.items = items
         self.bin_capacity = bin_capacity
         self.num_bees = num_bees
         self.max_iterations = max_iterations
+        self.stopping = stopping
+        self.telemetry = DISABLED if telemetry is None else telemetry
+        self.verbose = verbose
 
     def _initialize_population(self):
-        print("\nInitialization Phase:")
         population = []
         for i in range(self.num_bees):
             bins = [[] for _ in range(len(self.items))]
@@ -31,11 +44,9 @@ class BinPackingABC:
             
             bins = [bin for bin in bins if bin]
             population.append(bins)
-            print(f"  Bee {i+1}: {len(bins)} bins, Items per bin: {[len(b) for b in bins]}")
         return population
 
     def _employed_bees_phase(self, population: List[Any]):
-        print("\nEmployed Bees Phase:")
         new_population = []
         for i, solution in enumerate(population):
             new_solution = [bin.copy() for bin in solution]
@@ -51,12 +62,12 @@ class BinPackingABC:
                         new_solution[bin2].remove(item2)
                         new_solution[bin1].append(item2)
                         new_solution[bin2].append(item1)
-            print(f"  Bee {i+1}: {len(new_solution)} bins")
             new_population.append(new_solution)
+        if self.telemetry.phases:
+            self.telemetry.phase("employed", **_phase_stats([len(solution) for solution in new_population]))
         return new_population
 
     def _onlooker_bees_phase(self, population: List[Any]):
-        print("\nOnlooker Bees Phase:")
         new_population = []
         for i, solution in enumerate(population):
             new_solution = [bin.copy() for bin in solution]
@@ -65,12 +76,12 @@ class BinPackingABC:
                 if sum(new_solution[bin1]) + sum(new_solution[bin2]) <= self.bin_capacity:
                     new_solution[bin1].extend(new_solution[bin2])
                     new_solution.pop(bin2)
-            print(f"  Onlooker {i+1}: {len(new_solution)} bins")
             new_population.append(new_solution)
+        if self.telemetry.phases:
+            self.telemetry.phase("onlooker", **_phase_stats([len(solution) for solution in new_population]))
         return new_population
 
     def _scout_bee_phase(self, population: List[Any]):
-        print("\nScout Bees Phase:")
         new_population = []
         scouts = 0
         for solution in population:
@@ -80,24 +91,30 @@ class BinPackingABC:
                 scouts += 1
             else:
                 new_population.append(solution)
-        print(f"  {scouts} scouts found new solutions")
+        if self.telemetry.phases:
+            self.telemetry.phase("scout", scouts=scouts)
         return new_population
 
     def _evaluate_solution(self, solution):
         return len(solution)
 
     def run(self):
-        print("\n=== Bin Packing ABC Algorithm ===")
-        print(f"Items: {self.items}")
-        print(f"Bin Capacity: {self.bin_capacity}")
-        print(f"Bees: {self.num_bees}, Iterations: {self.max_iterations}")
-        
+        if self.verbose:
+            print("\n=== Bin Packing ABC Algorithm ===")
+            print(f"Items: {self.items}")
+            print(f"Bin Capacity: {self.bin_capacity}")
+            print(f"Bees: {self.num_bees}, Iterations: {self.max_iterations}")
+
+        self.telemetry.start(type(self).__name__, num_bees=self.num_bees, max_iterations=self.max_iterations)
+        stopping_state = None if self.stopping is None else self.stopping.start(minimize=True)
         population = self._initialize_population()
+        # The scouts also draw from _initialize_population, so the phase is reported here
+        if self.telemetry.phases:
+            self.telemetry.phase("initialization", **_phase_stats([len(solution) for solution in population]))
         best_solution = min(population, key=self._evaluate_solution)
         best_fitness = self._evaluate_solution(best_solution)
         
         for iteration in range(self.max_iterations):
-            print(f"\nIteration {iteration + 1}:")
             population = self._employed_bees_phase(population)
             population = self._onlooker_bees_phase(population)
             population = self._scout_bee_phase(population)
@@ -107,20 +124,32 @@ class BinPackingABC:
             if current_fitness < best_fitness:
                 best_solution = current_best
                 best_fitness = current_fitness
-                print(f"New best solution: {best_fitness} bins")
+
+            if self.telemetry.active:
+                self.telemetry.iteration(iteration + 1, best_fitness, evaluations=3 * self.num_bees)
+
+            if stopping_state is not None and stopping_state.update(best_fitness, 3 * self.num_bees):
+                break
+        self.telemetry.end(best_fitness)
         
-        print("\nFinal Best Solution:")
-        print(f"Number of bins: {best_fitness}")
-        for i, bin in enumerate(best_solution):
-            print(f"Bin {i+1}: sum={sum(bin)}, items={bin}")
+        if self.verbose:
+            print("\nFinal Best Solution:")
+            print(f"Number of bins: {best_fitness}")
+            for i, bin in enumerate(best_solution):
+                print(f"Bin {i+1}: sum={sum(bin)}, items={bin}")
         return best_solution, best_fitness
 
 class SetCoverABC:
-    def __init__(self, universe: Set[int], subsets: List[Set[int]], num_bees: int, max_iterations: int):
+    def __init__(self, universe: Set[int], subsets: List[Set[int]], num_bees: int, max_iterations: int,
+                 stopping: Optional[StoppingCriteria] = None, telemetry: Optional[Telemetry] = None,
+                 verbose: bool = False):
         self.universe = universe
         self.subsets = subsets
         self.num_bees = num_bees
         self.max_iterations = max_iterations
+        self.stopping = stopping
+        self.telemetry = DISABLED if telemetry is None else telemetry
+        self.verbose = verbose
 
     def _create_solution(self):
         solution = set()
@@ -137,16 +166,15 @@ class SetCoverABC:
         return solution
 
     def _initialize_population(self):
-        print("\nInitialization Phase:")
         population = []
         for i in range(self.num_bees):
             solution = self._create_solution()
             population.append(solution)
-            print(f"  Bee {i+1}: {len(solution)} subsets")
+        if self.telemetry.phases:
+            self.telemetry.phase("initialization", **_phase_stats([len(solution) for solution in population]))
         return population
 
     def _employed_bees_phase(self, population: List[Set[int]]):
-        print("\nEmployed Bees Phase:")
         new_population = []
         for i, solution in enumerate(population):
             new_solution = solution.copy()
@@ -161,12 +189,12 @@ class SetCoverABC:
                     new_subset = random.choice(list(available))
                     new_solution.add(new_subset)
                     uncovered = self.universe - set.union(*[self.subsets[idx] for idx in new_solution])
-            print(f"  Bee {i+1}: {len(new_solution)} subsets")
             new_population.append(new_solution)
+        if self.telemetry.phases:
+            self.telemetry.phase("employed", **_phase_stats([len(solution) for solution in new_population]))
         return new_population
 
     def _onlooker_bees_phase(self, population: List[Set[int]]):
-        print("\nOnlooker Bees Phase:")
         new_population = []
         for i, solution in enumerate(population):
             new_solution = solution.copy()
@@ -179,12 +207,12 @@ class SetCoverABC:
                         new_solution.remove(subset2)
                         new_solution.add(idx)
                         break
-            print(f"  Onlooker {i+1}: {len(new_solution)} subsets")
             new_population.append(new_solution)
+        if self.telemetry.phases:
+            self.telemetry.phase("onlooker", **_phase_stats([len(solution) for solution in new_population]))
         return new_population
 
     def _scout_bee_phase(self, population: List[Set[int]]):
-        print("\nScout Bees Phase:")
         new_population = []
         scouts = 0
         for solution in population:
@@ -194,21 +222,24 @@ class SetCoverABC:
                 scouts += 1
             else:
                 new_population.append(solution)
-        print(f"  {scouts} scouts found new solutions")
+        if self.telemetry.phases:
+            self.telemetry.phase("scout", scouts=scouts)
         return new_population
 
     def run(self):
-        print("\n=== Set Cover ABC Algorithm ===")
-        print(f"Universe: {self.universe}")
-        print(f"Subsets: {self.subsets}")
-        print(f"Bees: {self.num_bees}, Iterations: {self.max_iterations}")
-        
+        if self.verbose:
+            print("\n=== Set Cover ABC Algorithm ===")
+            print(f"Universe: {self.universe}")
+            print(f"Subsets: {self.subsets}")
+            print(f"Bees: {self.num_bees}, Iterations: {self.max_iterations}")
+
+        self.telemetry.start(type(self).__name__, num_bees=self.num_bees, max_iterations=self.max_iterations)
+        stopping_state = None if self.stopping is None else self.stopping.start(minimize=True)
         population = self._initialize_population()
         best_solution = min(population, key=len)
         best_fitness = len(best_solution)
         
         for iteration in range(self.max_iterations):
-            print(f"\nIteration {iteration + 1}:")
             population = self._employed_bees_phase(population)
             population = self._onlooker_bees_phase(population)
             population = self._scout_bee_phase(population)
@@ -218,20 +249,35 @@ class SetCoverABC:
             if current_fitness < best_fitness:
                 best_solution = current_best
                 best_fitness = current_fitness
-                print(f"New best solution: {best_fitness} subsets")
+
+            if self.telemetry.active:
+                self.telemetry.iteration(iteration + 1, best_fitness, evaluations=3 * self.num_bees)
+
+            if stopping_state is not None and stopping_state.update(best_fitness, 3 * self.num_bees):
+                break
+        self.telemetry.end(best_fitness)
         
-        print("\nFinal Best Solution:")
-        print(f"Number of subsets: {best_fitness}")
-        print(f"Selected subsets: {best_solution}")
-        print(f"Coverage: {set.union(*[self.subsets[idx] for idx in best_solution])}")
+        if self.verbose:
+            print("\nFinal Best Solution:")
+            print(f"Number of subsets: {best_fitness}")
+            print(f"Selected subsets: {best_solution}")
+            print(f"Coverage: {set.union(*[self.subsets[idx] for idx in best_solution])}")
         return best_solution, best_fitness
 
+# The onlookers copy food sources unchanged, so with cache_size the values are memoized
+# by the sorted item indices of a source (see heuristics.cache)
 class KnapsackABC:
-    def __init__(self, items: List[Tuple[int, int]], capacity: int, num_bees: int, max_iterations: int):
+    def __init__(self, items: List[Tuple[int, int]], capacity: int, num_bees: int, max_iterations: int,
+                 stopping: Optional[StoppingCriteria] = None, telemetry: Optional[Telemetry] = None,
+                 cache_size: Optional[int] = None, verbose: bool = False):
         self.items = items  # (weight, value) tuples
         self.capacity = capacity
         self.num_bees = num_bees
         self.max_iterations = max_iterations
+        self.stopping = stopping
+        self.telemetry = DISABLED if telemetry is None else telemetry
+        self.verbose = verbose
+        self.cache = None if cache_size is None else FitnessCache(subset_key, cache_size)
 
     def _create_solution(self):
         solution = set()
@@ -246,19 +292,25 @@ class KnapsackABC:
                 current_weight += weight
         return solution
 
+    def _total_value(self, solution):
+        return sum(self.items[idx][1] for idx in solution)
+
+    def _value(self, solution):
+        if self.cache is None:
+            return self._total_value(solution)
+        return self.cache.get(solution, self._total_value)
+
     def _initialize_population(self):
-        print("\nInitialization Phase:")
         population = []
         for i in range(self.num_bees):
             solution = self._create_solution()
             population.append(solution)
-            value = sum(self.items[idx][1] for idx in solution)
-            weight = sum(self.items[idx][0] for idx in solution)
-            print(f"  Bee {i+1}: value={value}, weight={weight}")
+        if self.telemetry.phases:
+            self.telemetry.phase("initialization", **_phase_stats(
+                [self._value(solution) for solution in population], False))
         return population
 
     def _employed_bees_phase(self, population: List[Set[int]]):
-        print("\nEmployed Bees Phase:")
         new_population = []
         for i, solution in enumerate(population):
             new_solution = solution.copy()
@@ -273,28 +325,28 @@ class KnapsackABC:
                         if current_weight + self.items[item][0] <= self.capacity:
                             new_solution.add(item)
                             current_weight += self.items[item][0]
-            value = sum(self.items[idx][1] for idx in new_solution)
-            print(f"  Bee {i+1}: value={value}")
             new_population.append(new_solution)
+        if self.telemetry.phases:
+            self.telemetry.phase("employed", **_phase_stats(
+                [self._value(solution) for solution in new_population], False))
         return new_population
 
     def _onlooker_bees_phase(self, population: List[Set[int]]):
-        print("\nOnlooker Bees Phase:")
         new_population = []
-        fitness_values = [sum(self.items[idx][1] for idx in solution) for solution in population]
+        fitness_values = [self._value(solution) for solution in population]
         total_fitness = sum(fitness_values)
-        probabilities = [f/total_fitness for f in fitness_values] if total_fitness > 0 else [1/len(population)]*len(population)
+        probabilities = WeightedSampler(fitness_values if total_fitness > 0 else [1]*len(population))
         
         for i in range(len(population)):
-            selected_idx = random.choices(range(len(population)), probabilities)[0]
+            selected_idx = probabilities.sample()
             new_solution = population[selected_idx].copy()
-            value = sum(self.items[idx][1] for idx in new_solution)
-            print(f"  Onlooker {i+1}: value={value}")
             new_population.append(new_solution)
+        if self.telemetry.phases:
+            self.telemetry.phase("onlooker", **_phase_stats(
+                [self._value(solution) for solution in new_population], False))
         return new_population
 
     def _scout_bee_phase(self, population: List[Set[int]]):
-        print("\nScout Bees Phase:")
         new_population = []
         scouts = 0
         for solution in population:
@@ -304,43 +356,63 @@ class KnapsackABC:
                 scouts += 1
             else:
                 new_population.append(solution)
-        print(f"  {scouts} scouts found new solutions")
+        if self.telemetry.phases:
+            self.telemetry.phase("scout", scouts=scouts)
         return new_population
 
     def run(self):
-        print("\n=== Knapsack ABC Algorithm ===")
-        print(f"Items (weight, value): {self.items}")
-        print(f"Capacity: {self.capacity}")
-        print(f"Bees: {self.num_bees}, Iterations: {self.max_iterations}")
-        
+        if self.verbose:
+            print("\n=== Knapsack ABC Algorithm ===")
+            print(f"Items (weight, value): {self.items}")
+            print(f"Capacity: {self.capacity}")
+            print(f"Bees: {self.num_bees}, Iterations: {self.max_iterations}")
+
+        self.telemetry.start(type(self).__name__, num_bees=self.num_bees, max_iterations=self.max_iterations)
+        stopping_state = None if self.stopping is None else self.stopping.start(minimize=False)
         population = self._initialize_population()
-        best_solution = max(population, key=lambda s: sum(self.items[idx][1] for idx in s))
-        best_fitness = sum(self.items[idx][1] for idx in best_solution)
+        best_solution = max(population, key=self._value)
+        best_fitness = self._value(best_solution)
         
         for iteration in range(self.max_iterations):
-            print(f"\nIteration {iteration + 1}:")
             population = self._employed_bees_phase(population)
             population = self._onlooker_bees_phase(population)
             population = self._scout_bee_phase(population)
             
-            current_best = max(population, key=lambda s: sum(self.items[idx][1] for idx in s))
-            current_fitness = sum(self.items[idx][1] for idx in current_best)
+            current_best = max(population, key=self._value)
+            current_fitness = self._value(current_best)
             if current_fitness > best_fitness:
                 best_solution = current_best
                 best_fitness = current_fitness
-                print(f"New best solution: value={best_fitness}")
+
+            if self.telemetry.active:
+                self.telemetry.iteration(iteration + 1, best_fitness, evaluations=3 * self.num_bees)
+
+            if stopping_state is not None and stopping_state.update(best_fitness, 3 * self.num_bees):
+                break
+        self.telemetry.end(best_fitness, cache=None if self.cache is None else self.cache.stats())
         
-        print("\nFinal Best Solution:")
-        print(f"Total value: {best_fitness}")
-        print(f"Total weight: {sum(self.items[idx][0] for idx in best_solution)}")
-        print(f"Selected items: {[(idx, self.items[idx]) for idx in best_solution]}")
+        if self.verbose:
+            print("\nFinal Best Solution:")
+            print(f"Total value: {best_fitness}")
+            print(f"Total weight: {sum(self.items[idx][0] for idx in best_solution)}")
+            print(f"Selected items: {[(idx, self.items[idx]) for idx in best_solution]}")
         return best_solution, best_fitness
 
+# objective is a sequencing objective from heuristics.scheduling, by default the total
+# completion time of the jobs in order. The colony keeps the score of every food source
+# next to it, and the objective's prepare() state once a source is explored; the swaps of
+# the employed bees and the reversals of the onlookers are scored as deltas from it.
 class JobSchedulingABC:
-    def __init__(self, job_durations: List[int], num_bees: int, max_iterations: int):
+    def __init__(self, job_durations: List[int], num_bees: int, max_iterations: int,
+                 stopping: Optional[StoppingCriteria] = None, telemetry: Optional[Telemetry] = None,
+                 objective: Optional[Any] = None, verbose: bool = False):
         self.job_durations = job_durations
+        self.objective = CompletionTime(job_durations) if objective is None else objective
         self.num_bees = num_bees
         self.max_iterations = max_iterations
+        self.stopping = stopping
+        self.telemetry = DISABLED if telemetry is None else telemetry
+        self.verbose = verbose
 
     def _create_solution(self):
         solution = list(range(len(self.job_durations)))
@@ -348,95 +420,117 @@ class JobSchedulingABC:
         return solution
 
     def _initialize_population(self):
-        print("\nInitialization Phase:")
         population = []
         for i in range(self.num_bees):
             solution = self._create_solution()
             population.append(solution)
-            completion_time = self._evaluate_solution(solution)
-            print(f"  Bee {i+1}: completion time={completion_time}")
         return population
 
     def _evaluate_solution(self, solution):
-        completion_time = 0
-        for job_idx in solution:
-            completion_time += self.job_durations[job_idx]
-        return completion_time
+        return self.objective.evaluate(solution)
+
+    # prepare() state of population[i], built on the first move from it in a phase
+    def _state(self, population, states, i):
+        if states[i] is None:
+            states[i] = self.objective.prepare(population[i])
+        return states[i]
 
-    def _employed_bees_phase(self, population: List[List[int]]):
-        print("\nEmployed Bees Phase:")
+    def _employed_bees_phase(self, population: List[List[int]], scores: List[float]):
         new_population = []
+        new_scores = []
+        states = [None] * len(population)
         for i, solution in enumerate(population):
             new_solution = solution.copy()
+            score = scores[i]
             # Swap two random jobs
             if len(new_solution) >= 2:
                 idx1, idx2 = random.sample(range(len(new_solution)), 2)
+                score += self.objective.swap_delta(solution, self._state(population, states, i), idx1, idx2)
                 new_solution[idx1], new_solution[idx2] = new_solution[idx2], new_solution[idx1]
-            completion_time = self._evaluate_solution(new_solution)
-            print(f"  Bee {i+1}: completion time={completion_time}")
             new_population.append(new_solution)
-        return new_population
+            new_scores.append(score)
+        if self.telemetry.phases:
+            self.telemetry.phase("employed", **_phase_stats(new_scores))
+        return new_population, new_scores
 
-    def _onlooker_bees_phase(self, population: List[List[int]]):
-        print("\nOnlooker Bees Phase:")
+    def _onlooker_bees_phase(self, population: List[List[int]], scores: List[float]):
         new_population = []
-        fitness_values = [1/self._evaluate_solution(solution) for solution in population]
-        total_fitness = sum(fitness_values)
-        probabilities = [f/total_fitness for f in fitness_values]
+        new_scores = []
+        states = [None] * len(population)
+        fitness_values = [1/score for score in scores]
+        probabilities = WeightedSampler(fitness_values)
         
         for i in range(len(population)):
-            selected_idx = random.choices(range(len(population)), probabilities)[0]
+            selected_idx = probabilities.sample()
             new_solution = population[selected_idx].copy()
+            score = scores[selected_idx]
             # Try to improve by reversing a subsequence
             if len(new_solution) >= 2:
                 start = random.randint(0, len(new_solution)-2)
                 end = random.randint(start+1, len(new_solution))
+                score += self.objective.reverse_delta(population[selected_idx],
+                                                      self._state(population, states, selected_idx), start, end)
                 new_solution[start:end] = reversed(new_solution[start:end])
-            completion_time = self._evaluate_solution(new_solution)
-            print(f"  Onlooker {i+1}: completion time={completion_time}")
             new_population.append(new_solution)
-        return new_population
+            new_scores.append(score)
+        if self.telemetry.phases:
+            self.telemetry.phase("onlooker", **_phase_stats(new_scores))
+        return new_population, new_scores
 
-    def _scout_bee_phase(self, population: List[List[int]]):
-        print("\nScout Bees Phase:")
+    def _scout_bee_phase(self, population: List[List[int]], scores: List[float]):
         new_population = []
+        new_scores = []
         scouts = 0
-        for solution in population:
+        for solution, score in zip(population, scores):
             if random.random() < 0.1:
                 new_solution = self._create_solution()
                 new_population.append(new_solution)
+                new_scores.append(self._evaluate_solution(new_solution))
                 scouts += 1
             else:
                 new_population.append(solution)
-        print(f"  {scouts} scouts found new solutions")
-        return new_population
+                new_scores.append(score)
+        if self.telemetry.phases:
+            self.telemetry.phase("scout", scouts=scouts)
+        return new_population, new_scores
 
     def run(self):
-        print("\n=== Job Scheduling ABC Algorithm ===")
-        print(f"Job durations: {self.job_durations}")
-        print(f"Bees: {self.num_bees}, Iterations: {self.max_iterations}")
-        
+        if self.verbose:
+            print("\n=== Job Scheduling ABC Algorithm ===")
+            print(f"Job durations: {self.job_durations}")
+            print(f"Bees: {self.num_bees}, Iterations: {self.max_iterations}")
+
+        self.telemetry.start(type(self).__name__, num_bees=self.num_bees, max_iterations=self.max_iterations)
+        stopping_state = None if self.stopping is None else self.stopping.start(minimize=True)
         population = self._initialize_population()
-        best_solution = min(population, key=self._evaluate_solution)
-        best_fitness = self._evaluate_solution(best_solution)
+        scores = [self._evaluate_solution(solution) for solution in population]
+        if self.telemetry.phases:
+            self.telemetry.phase("initialization", **_phase_stats(scores))
+        best_fitness = min(scores)
+        best_solution = population[scores.index(best_fitness)]
         
         for iteration in range(self.max_iterations):
-            print(f"\nIteration {iteration + 1}:")
-            population = self._employed_bees_phase(population)
-            population = self._onlooker_bees_phase(population)
-            population = self._scout_bee_phase(population)
+            population, scores = self._employed_bees_phase(population, scores)
+            population, scores = self._onlooker_bees_phase(population, scores)
+            population, scores = self._scout_bee_phase(population, scores)
             
-            current_best = min(population, key=self._evaluate_solution)
-            current_fitness = self._evaluate_solution(current_best)
+            current_fitness = min(scores)
             if current_fitness < best_fitness:
-                best_solution = current_best
+                best_solution = population[scores.index(current_fitness)]
                 best_fitness = current_fitness
-                print(f"New best solution: completion time={best_fitness}")
+
+            if self.telemetry.active:
+                self.telemetry.iteration(iteration + 1, best_fitness, evaluations=3 * self.num_bees)
+
+            if stopping_state is not None and stopping_state.update(best_fitness, 3 * self.num_bees):
+                break
+        self.telemetry.end(best_fitness)
         
-        print("\nFinal Best Solution:")
-        print(f"Job sequence: {best_solution}")
-        print(f"Job durations: {[self.job_durations[i] for i in best_solution]}")
-        print(f"Total completion time: {best_fitness}")
+        if self.verbose:
+            print("\nFinal Best Solution:")
+            print(f"Job sequence: {best_solution}")
+            print(f"Job durations: {[self.job_durations[i] for i in best_solution]}")
+            print(f"{self.objective.name}: {best_fitness}")
         return best_solution, best_fitness
 
 # Test runs for all algorithms
@@ -451,14 +545,14 @@ def run_all_tests():
     # print("\nTest 1: Bin Packing Problem")
     # items = [5, 10, 15, 20, 25]
     # bin_capacity = 30
-    # bin_packing = BinPackingABC(items, bin_capacity, num_bees, max_iterations)
+    # bin_packing = BinPackingABC(items, bin_capacity, num_bees, max_iterations, verbose=True)
     # bin_packing.run()
 
     # # Test 2: Set Cover
     # print("\nTest 2: Set Cover Problem")
     # universe = {1, 2, 3, 4, 5}
     # subsets = [{1, 2}, {2, 3}, {3, 4}, {4, 5}, {1, 5}]
-    # set_cover = SetCoverABC(universe, subsets, num_bees, max_iterations)
+    # set_cover = SetCoverABC(universe, subsets, num_bees, max_iterations, verbose=True)
     # set_cover.run()
 
     # Test 3: Knapsack
@@ -472,13 +566,13 @@ def run_all_tests():
     #         (29, 130), (95, 310), (77, 280), (62, 250), (49, 180), (60, 170), (73, 290), (80, 320)
     # ]    
     # capacity = 510
-    # knapsack = KnapsackABC(items, capacity, num_bees, max_iterations)
+    # knapsack = KnapsackABC(items, capacity, num_bees, max_iterations, verbose=True)
     # knapsack.run()
 
     # Test 4: Job Scheduling
     print("\nTest 4: Job Scheduling Problem")
     job_durations = [2, 3, 4, 5, 6]
-    job_scheduling = JobSchedulingABC(job_durations, num_bees, max_iterations)
+    job_scheduling = JobSchedulingABC(job_durations, num_bees, max_iterations, verbose=True)
     job_scheduling.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,67 @@
+from collections import OrderedDict
+
+# Canonical keys: encodings of the same solution get the same key
+
+def subset_key(solution):
+    # Selected indices in any order, as a list or a set
+    return tuple(sorted(solution))
+
+def bins_key(bins):
+    # The multiset of bin contents: bins in any order, items in a bin in any order, empty
+    # bins ignored
+    return tuple(sorted(tuple(sorted(bin)) for bin in bins if bin))
+
+def sequence_key(order):
+    return tuple(order)
+
+# Memo of objective values keyed by the canonical key of the encoding, so a solution that
+# comes back (an unmutated clone, a copied food source, a mutation undone by a later one)
+# is not evaluated again. At most max_size entries are kept; past that the least recently
+# used one is dropped. Solvers take cache_size and build their own cache with the key of
+# their encoding, and with it also drop duplicates when inserting into a population
+# (is_duplicate), so the evaluations go to solutions not seen yet.
+class FitnessCache:
+    def __init__(self, key=subset_key, max_size=100_000):
+        self.key = key
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.duplicates = 0
+
+    def get(self, solution, evaluate, key=None):
+        if key is None:
+            key = self.key(solution)
+        entries = self.entries
+        if key in entries:
+            self.hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+        self.misses += 1
+        value = entries[key] = evaluate(solution)
+        if len(entries) > self.max_size:
+            entries.popitem(last=False)
+        return value
+
+    # Adds key to seen, the keys of a population, unless it is there already
+    def is_duplicate(self, key, seen):
+        if key in seen:
+            self.duplicates += 1
+            return True
+        seen.add(key)
+        return False
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate, "duplicates": self.duplicates,
+                "size": len(self.entries)}
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.duplicates = 0
@@ -0,0 +1,711 @@
+import random
+import numpy as np
+from typing import List, Tuple, Any, Set, Optional
+
+from .cache import FitnessCache, bins_key, sequence_key, subset_key
+from .scheduling import CompletionTime
+from .set_cover import SetCoverInstance
+from .stopping import StoppingCriteria
+from .telemetry import DISABLED, Telemetry
+
+# An individual of an AIS population: its encoding with the objective value and the
+# feasibility the solver computed for it. A clone starts with its parent's cached values
+# and a mutation calls invalidate(), so each encoding is evaluated once and selection only
+# compares cached numbers. state keeps whatever else a solver caches to mutate or
+# evaluate the antibody cheaply, such as the weight of a knapsack, and key the canonical
+# key of the encoding when the solver uses a FitnessCache.
+class Antibody:
+    __slots__ = ("encoding", "fitness", "feasible", "state", "key")
+
+    def __init__(self, encoding, fitness=None, feasible=True, state=None):
+        self.encoding = encoding
+        self.fitness = fitness
+        self.feasible = feasible
+        self.state = state
+        self.key = None
+
+    def clone(self, encoding):
+        return Antibody(encoding, self.fitness, self.feasible, self.state)
+
+    def invalidate(self):
+        self.fitness = None
+
+    def __repr__(self):
+        return f"Antibody({self.encoding!r}, fitness={self.fitness!r}, feasible={self.feasible!r})"
+
+# Canonical keys of the antibodies of a population, computed once per antibody
+def _population_keys(population, cache):
+    for antibody in population:
+        if antibody.key is None:
+            antibody.key = cache.key(antibody.encoding)
+    return {antibody.key for antibody in population}
+
+# With a cache, clones equal to an antibody already in the population (seen, from
+# _population_keys) are dropped before being evaluated. An unchanged clone equals its
+# parent, whose key is in seen, so it is counted as a duplicate without hashing it.
+def _is_duplicate_clone(clone, parent, cache, seen):
+    if clone.encoding == parent.encoding:
+        return cache.is_duplicate(parent.key, seen)
+    clone.key = cache.key(clone.encoding)
+    return cache.is_duplicate(clone.key, seen)
+
+class BinPackingAIS:
+    def __init__(self, items: List[int], bin_capacity: int, population_size: int, max_generations: int,
+                 clone_rate: float = 0.1, mutation_rate: float = 0.2,
+                 stopping: Optional[StoppingCriteria] = None, telemetry: Optional[Telemetry] = None,
+                 cache_size: Optional[int] = None, verbose: bool = False):
+        self.items = items
+        self.bin_capacity = bin_capacity
+        self.population_size = population_size
+        self.max_generations = max_generations
+        self.clone_rate = clone_rate
+        self.mutation_rate = mutation_rate
+        self.stopping = stopping
+        self.telemetry = DISABLED if telemetry is None else telemetry
+        self.verbose = verbose
+        self.evaluations = 0
+        self.cache = None if cache_size is None else FitnessCache(bins_key, cache_size)
+
+    def _initialize_population(self):
+        population = []
+        for _ in range(self.population_size):
+            solution = self._create_individual_solution()
+            population.append(self._evaluate(Antibody(solution)))
+        return population
+
+    def _create_individual_solution(self):
+        bins = [[]]  # Start with one empty bin
+        items_copy = self.items.copy()
+        random.shuffle(items_copy)
+        
+        for item in items_copy:
+            placed = False
+            for bin in bins:
+                if sum(bin) + item <= self.bin_capacity:
+                    bin.append(item)
+                    placed = True
+                    break
+            if not placed:
+                bins.append([item])
+        return bins
+
+    def _clone_and_hypermutate(self, population):
+        clones = []
+        seen = None if self.cache is None else _population_keys(population, self.cache)
+        for solution in population:
+            if random.random() < self.clone_rate:
+                clone = solution.clone([bin.copy() for bin in solution.encoding])
+                if random.random() < self.mutation_rate:
+                    # Mutation: Move a random item to a different bin or create new bin
+                    bins = clone.encoding
+                    if len(bins) > 1:
+                        source_bin = random.choice(bins)
+                        if source_bin:
+                            item = random.choice(source_bin)
+                            source_bin.remove(item)
+                            target_bin = random.choice(bins)
+                            if sum(target_bin) + item <= self.bin_capacity:
+                                target_bin.append(item)
+                            else:
+                                bins.append([item])
+                            clone.invalidate()
+                if seen is not None and _is_duplicate_clone(clone, solution, self.cache, seen):
+                    continue
+                clones.append(self._evaluate(clone))
+        return population + clones
+
+    def _select_population(self, population):
+        # Sort by fitness (number of bins) and keep the best solutions
+        population.sort(key=lambda antibody: antibody.fitness)
+        return population[:self.population_size]
+
+    def _evaluate_solution(self, solution):
+        return len([bin for bin in solution if bin])
+
+    def _score(self, solution):
+        self.evaluations += 1
+        return self._evaluate_solution(solution)
+
+    def _evaluate(self, antibody):
+        if antibody.fitness is None:
+            if self.cache is None:
+                antibody.fitness = self._score(antibody.encoding)
+            else:
+                antibody.fitness = self.cache.get(antibody.encoding, self._score, antibody.key)
+        return antibody
+
+    def run(self):
+        if self.verbose:
+            print(f"Bin Packing AIS Configuration:")
+            print(f"  Items: {self.items}")
+            print(f"  Bin Capacity: {self.bin_capacity}")
+            print(f"  Population Size: {self.population_size}")
+            print(f"  Maximum Generations: {self.max_generations}")
+
+        self.telemetry.start(type(self).__name__, population_size=self.population_size,
+                             max_generations=self.max_generations)
+        stopping_state = None if self.stopping is None else self.stopping.start(minimize=True)
+        self.evaluations = 0
+        population = self._initialize_population()
+        best = min(population, key=lambda antibody: antibody.fitness)
+        best_solution, best_fitness = best.encoding, best.fitness
+        
+        for generation in range(self.max_generations):
+            evaluated = self.evaluations
+            population = self._clone_and_hypermutate(population)
+            evaluations = self.evaluations - evaluated
+            population = self._select_population(population)
+            
+            # The population is sorted by fitness
+            current_best = population[0]
+            current_fitness = current_best.fitness
+            
+            if current_fitness < best_fitness:
+                best_solution = current_best.encoding
+                best_fitness = current_fitness
+
+            if self.telemetry.active:
+                self.telemetry.phase("selection", candidates=evaluations, best=current_fitness)
+                self.telemetry.iteration(generation + 1, best_fitness, evaluations=evaluations)
+            if stopping_state is not None and stopping_state.update(best_fitness, evaluations):
+                break
+
+        self.telemetry.end(best_fitness, cache=None if self.cache is None else self.cache.stats())
+        if self.verbose:
+            print(f"Best Bin Packing Solution:")
+            print(f"  Bin assignments: {best_solution}")
+            print(f"  Number of bins used: {best_fitness}")
+            print("-" * 50)
+        return best_solution, best_fitness
+
+# Clones are scored from their parent's coverage state, so no objective values are
+# memoized: cache_size only enables dropping duplicate clones, and only that count is
+# reported at the end of the run.
+class SetCoverAIS:
+    def __init__(self, universe: Set, subsets: List[Set], population_size: int, max_generations: int,
+                 clone_rate: float = 0.1, mutation_rate: float = 0.2,
+                 stopping: Optional[StoppingCriteria] = None, telemetry: Optional[Telemetry] = None,
+                 cache_size: Optional[int] = None, verbose: bool = False):
+        self.universe = universe
+        self.subsets = subsets
+        # Subsets as bitmasks over the universe; an antibody's state is its coverage mask
+        # and, per element, the number of its subsets covering it
+        self.instance = SetCoverInstance(universe, subsets)
+        self.population_size = population_size
+        self.max_generations = max_generations
+        self.clone_rate = clone_rate
+        self.mutation_rate = mutation_rate
+        self.stopping = stopping
+        self.telemetry = DISABLED if telemetry is None else telemetry
+        self.verbose = verbose
+        self.evaluations = 0
+        self.cache = None if cache_size is None else FitnessCache(subset_key, cache_size)
+
+    def _initialize_population(self):
+        population = []
+        for _ in range(self.population_size):
+            solution = self._create_individual_solution()
+            population.append(self._evaluate(Antibody(solution)))
+        return population
+
+    def _create_individual_solution(self):
+        selected_subsets = []
+        covered_elements = 0
+        available_subsets = list(range(len(self.subsets)))
+        
+        while covered_elements != self.instance.universe_mask and available_subsets:
+            subset_idx = random.choice(available_subsets)
+            selected_subsets.append(subset_idx)
+            covered_elements |= self.instance.masks[subset_idx]
+            available_subsets.remove(subset_idx)
+            
+        return selected_subsets
+
+    def _clone_and_hypermutate(self, population):
+        clones = []
+        seen = None if self.cache is None else _population_keys(population, self.cache)
+        for solution in population:
+            if random.random() < self.clone_rate:
+                clone = solution.clone(solution.encoding.copy())
+                if random.random() < self.mutation_rate:
+                    # Mutation: Add or remove a random subset
+                    selected = clone.encoding
+                    if random.random() < 0.5 and len(selected) > 1:
+                        subset_idx = random.choice(selected)
+                        selected.remove(subset_idx)
+                        self._update_coverage(clone, subset_idx, -1)
+                    else:
+                        available = set(range(len(self.subsets))) - set(selected)
+                        if available:
+                            subset_idx = random.choice(list(available))
+                            selected.append(subset_idx)
+                            self._update_coverage(clone, subset_idx, 1)
+                if seen is not None and _is_duplicate_clone(clone, solution, self.cache, seen):
+                    continue
+                clones.append(self._evaluate(clone))
+        return population + clones
+
+    def _is_valid_solution(self, solution):
+        return self.instance.covers(solution)
+
+    def _evaluate(self, antibody):
+        if antibody.fitness is None:
+            antibody.fitness = self.instance.cost(antibody.encoding)
+            antibody.state = (self.instance.coverage(antibody.encoding),
+                              self.instance.coverage_counts(antibody.encoding))
+            antibody.feasible = antibody.state[0] == self.instance.universe_mask
+            self.evaluations += 1
+        return antibody
+
+    # Adds (change=1) or removes (change=-1) subset_idx in the coverage of a mutated clone,
+    # touching only the elements of that subset. The clone's counts are shared with its
+    # parent until here, so they are copied first.
+    def _update_coverage(self, antibody, subset_idx, change):
+        mask, counts = antibody.state
+        counts = counts.copy()
+        elements = self.instance.subset(subset_idx)
+        counts[elements] += change
+        if change > 0:
+            mask |= self.instance.masks[subset_idx]
+        else:
+            uncovered = elements[counts[elements] == 0]
+            if len(uncovered):
+                mask &= ~self.instance.positions_mask(uncovered)
+        antibody.state = (mask, counts)
+        antibody.fitness += change * self.instance.costs[subset_idx]
+        antibody.feasible = mask == self.instance.universe_mask
+        self.evaluations += 1
+
+    def _select_population(self, population):
+        # Filter valid solutions and sort by size
+        valid_solutions = [antibody for antibody in population if antibody.feasible]
+        if not valid_solutions:
+            return population[:self.population_size]
+        valid_solutions.sort(key=lambda antibody: antibody.fitness)
+        return valid_solutions[:self.population_size]
+
+    def run(self):
+        if self.verbose:
+            print(f"Set Cover AIS Configuration:")
+            print(f"  Universe: {self.universe}")
+            print(f"  Subsets: {self.subsets}")
+            print(f"  Population Size: {self.population_size}")
+            print(f"  Maximum Generations: {self.max_generations}")
+
+        self.telemetry.start(type(self).__name__, population_size=self.population_size,
+                             max_generations=self.max_generations)
+        stopping_state = None if self.stopping is None else self.stopping.start(minimize=True)
+        self.evaluations = 0
+        population = self._initialize_population()
+        best = min((antibody for antibody in population if antibody.feasible),
+                   key=lambda antibody: antibody.fitness, default=population[0])
+        best_solution = best.encoding
+        
+        for generation in range(self.max_generations):
+            evaluated = self.evaluations
+            population = self._clone_and_hypermutate(population)
+            evaluations = self.evaluations - evaluated
+            population = self._select_population(population)
+            
+            # Sorted by size unless no antibody is valid
+            current_best = population[0]
+            
+            if current_best.fitness < len(best_solution) and current_best.feasible:
+                best_solution = current_best.encoding
+
+            if self.telemetry.active:
+                self.telemetry.phase("selection", candidates=evaluations, best=current_best.fitness)
+                self.telemetry.iteration(generation + 1, len(best_solution), evaluations=evaluations)
+            if stopping_state is not None and stopping_state.update(len(best_solution), evaluations):
+                break
+
+        self.telemetry.end(len(best_solution),
+                           cache=None if self.cache is None else {"duplicates": self.cache.duplicates})
+        if self.verbose:
+            print(f"Best Set Cover Solution:")
+            print(f"  Selected subsets: {best_solution}")
+            print(f"  Number of subsets used: {len(best_solution)}")
+            print("-" * 50)
+        return best_solution
+
+# With clonalg=True the solver runs CLONALG on a population matrix (see _run_clonalg)
+# instead of cloning Antibody objects; clone_rate and mutation_rate are then unused and
+# clone_factor, max_flips, replacement_rate and seed apply.
+class KnapsackAIS:
+    def __init__(self, items: List[Tuple[int, int]], capacity: int, population_size: int,
+                 max_generations: int, clone_rate: float = 0.1, mutation_rate: float = 0.2,
+                 stopping: Optional[StoppingCriteria] = None, telemetry: Optional[Telemetry] = None,
+                 clonalg: bool = False, clone_factor: float = 1.0, max_flips: float = 10,
+                 replacement_rate: float = 0.1, seed: Optional[int] = None, cache_size: Optional[int] = None,
+                 verbose: bool = False):
+        self.items = items
+        self.capacity = capacity
+        self.population_size = population_size
+        self.max_generations = max_generations
+        self.clone_rate = clone_rate
+        self.mutation_rate = mutation_rate
+        self.stopping = stopping
+        self.telemetry = DISABLED if telemetry is None else telemetry
+        self.verbose = verbose
+        self.evaluations = 0
+        self.cache = None if cache_size is None else FitnessCache(subset_key, cache_size)
+        self.clonalg = clonalg
+        self.clone_factor = clone_factor
+        self.max_flips = max_flips
+        self.replacement_rate = replacement_rate
+        self.seed = seed
+
+    def _initialize_population(self):
+        population = []
+        for _ in range(self.population_size):
+            solution = self._create_individual_solution()
+            population.append(self._evaluate(Antibody(solution)))
+        return population
+
+    def _create_individual_solution(self):
+        solution = []
+        current_weight = 0
+        items_indices = list(range(len(self.items)))
+        random.shuffle(items_indices)
+        
+        for idx in items_indices:
+            weight, _ = self.items[idx]
+            if current_weight + weight <= self.capacity:
+                solution.append(idx)
+                current_weight += weight
+        
+        return solution
+
+    def _clone_and_hypermutate(self, population):
+        clones = []
+        seen = None if self.cache is None else _population_keys(population, self.cache)
+        for solution in population:
+            if random.random() < self.clone_rate:
+                clone = solution.clone(solution.encoding.copy())
+                if random.random() < self.mutation_rate:
+                    # Mutation: Add or remove an item
+                    selected = clone.encoding
+                    if random.random() < 0.5 and selected:
+                        selected.remove(random.choice(selected))
+                        clone.invalidate()
+                    else:
+                        available = set(range(len(self.items))) - set(selected)
+                        if available:
+                            new_item = random.choice(list(available))
+                            # state is the cached weight of the parent
+                            if clone.state + self.items[new_item][0] <= self.capacity:
+                                selected.append(new_item)
+                                clone.invalidate()
+                if seen is not None and _is_duplicate_clone(clone, solution, self.cache, seen):
+                    continue
+                clones.append(self._evaluate(clone))
+        return population + clones
+
+    def _get_weight(self, solution):
+        return sum(self.items[idx][0] for idx in solution)
+
+    def _get_value(self, solution):
+        return sum(self.items[idx][1] for idx in solution)
+
+    def _score(self, solution):
+        self.evaluations += 1
+        return self._get_value(solution), self._get_weight(solution)
+
+    def _evaluate(self, antibody):
+        if antibody.fitness is None:
+            if self.cache is None:
+                antibody.fitness, antibody.state = self._score(antibody.encoding)
+            else:
+                antibody.fitness, antibody.state = self.cache.get(antibody.encoding, self._score, antibody.key)
+            antibody.feasible = antibody.state <= self.capacity
+        return antibody
+
+    def _select_population(self, population):
+        # Filter valid solutions and sort by value
+        valid_solutions = [antibody for antibody in population if antibody.feasible]
+        valid_solutions.sort(key=lambda antibody: antibody.fitness, reverse=True)
+        return valid_solutions[:self.population_size]
+
+    def _run_generations(self, stopping_state):
+        self.evaluations = 0
+        population = self._initialize_population()
+        best = max(population, key=lambda antibody: antibody.fitness)
+        best_solution, best_value, best_weight = best.encoding, best.fitness, best.state
+        
+        for generation in range(self.max_generations):
+            evaluated = self.evaluations
+            population = self._clone_and_hypermutate(population)
+            evaluations = self.evaluations - evaluated
+            population = self._select_population(population)
+            
+            # The population is sorted by value
+            current_best = population[0]
+            current_value = current_best.fitness
+            
+            if current_value > best_value:
+                best_solution, best_value, best_weight = current_best.encoding, current_value, current_best.state
+
+            if self.telemetry.active:
+                self.telemetry.phase("selection", candidates=evaluations, best=current_value)
+                self.telemetry.iteration(generation + 1, best_value, evaluations=evaluations)
+            if stopping_state is not None and stopping_state.update(best_value, evaluations):
+                break
+        return best_solution, best_value, best_weight
+
+    # CLONALG (de Castro and Von Zuben) on an (N x n) bool matrix whose rows are the
+    # antibodies; values and weights of new rows are one matrix-vector product each.
+    # Every generation the antibody of affinity rank r gets round(clone_factor * N / r)
+    # clones, and each clone flips a Poisson number of random items with mean
+    # max_flips ** (1 - affinity), affinity being the value scaled to [0, 1]: the best
+    # antibody flips about one item, the worst max_flips. A clone is scored from its
+    # parent's value and weight and the items it flips, so clones are never materialized;
+    # the best feasible clone of each antibody replaces it if it is better. Then the worst
+    # replacement_rate of the population is redrawn at random. Random rows are repaired by
+    # dropping items in increasing order of value/weight until they fit.
+    def _run_clonalg(self, stopping_state):
+        rng = np.random.default_rng(self.seed)
+        weights = np.array([weight for weight, _ in self.items])
+        values = np.array([value for _, value in self.items])
+        num_items = len(self.items)
+        size = self.population_size
+        order = np.argsort(-values / weights, kind="stable")
+        density = min(1.0, self.capacity / weights.sum())
+        replaced = round(self.replacement_rate * size)
+
+        def random_antibodies(count):
+            ordered = rng.random((count, num_items)) < density
+            # Dropping items from the end of the order until the row fits keeps the prefix
+            # whose cumulative weight is within capacity
+            ordered &= np.cumsum(ordered * weights[order], axis=1) <= self.capacity
+            antibodies = np.empty_like(ordered)
+            antibodies[:, order] = ordered
+            return antibodies
+
+        population = random_antibodies(size)
+        value = population @ values
+        weight = population @ weights
+        best = value.argmax()
+        best_solution, best_value, best_weight = np.flatnonzero(population[best]).tolist(), value[best], weight[best]
+        parent_ids = np.arange(size)
+
+        for generation in range(self.max_generations):
+            ranks = np.empty(size, dtype=np.int64)
+            ranks[np.argsort(-value, kind="stable")] = np.arange(1, size + 1)
+            clone_counts = np.maximum(1, np.rint(self.clone_factor * size / ranks)).astype(np.int64)
+            spread = value.max() - value.min()
+            affinity = (value - value.min()) / spread if spread > 0 else np.ones(size)
+            parents = np.repeat(parent_ids, clone_counts)
+            num_clones = len(parents)
+
+            # Flipped (clone, item) pairs; an item drawn twice for a clone is unchanged
+            flip_counts = np.maximum(1, rng.poisson(self.max_flips ** (1 - affinity[parents])))
+            keys, counts = np.unique(np.repeat(np.arange(num_clones), flip_counts) * num_items
+                                     + rng.integers(num_items, size=flip_counts.sum()), return_counts=True)
+            clones, items = np.divmod(keys[counts % 2 == 1], num_items)
+            sign = np.where(population[parents[clones], items], -1, 1)
+            clone_value = value[parents] + np.bincount(clones, sign * values[items], minlength=num_clones)
+            clone_weight = weight[parents] + np.bincount(clones, sign * weights[items], minlength=num_clones)
+            clone_value[clone_weight > self.capacity] = -np.inf
+
+            # Clones of one antibody are contiguous, so after sorting by (parent, -value) the
+            # best clone of each antibody starts its block
+            chosen = np.lexsort((-clone_value, parents))[np.cumsum(clone_counts) - clone_counts]
+            improved = clone_value[chosen] > value
+            chosen = chosen[improved]
+            selected = np.zeros(num_clones, dtype=bool)
+            selected[chosen] = True
+            flips = selected[clones]
+            population[parents[clones[flips]], items[flips]] ^= True
+            value[improved] = clone_value[chosen]
+            weight[improved] = clone_weight[chosen]
+
+            if replaced:
+                worst = np.argsort(value, kind="stable")[:replaced]
+                population[worst] = random_antibodies(replaced)
+                value[worst] = population[worst] @ values
+                weight[worst] = population[worst] @ weights
+
+            evaluations = num_clones + replaced
+            current = value.argmax()
+            if value[current] > best_value:
+                best_solution = np.flatnonzero(population[current]).tolist()
+                best_value, best_weight = value[current], weight[current]
+
+            if self.telemetry.active:
+                self.telemetry.phase("cloning", clones=num_clones, improved=int(improved.sum()))
+                self.telemetry.phase("selection", candidates=evaluations, best=value[current].item())
+                self.telemetry.iteration(generation + 1, best_value.item(), evaluations=evaluations)
+            if stopping_state is not None and stopping_state.update(best_value, evaluations):
+                break
+        return best_solution, best_value.item(), best_weight.item()
+
+    def run(self):
+        if self.verbose:
+            print(f"Knapsack AIS Configuration:")
+            print(f"  Items: {self.items}")
+            print(f"  Capacity: {self.capacity}")
+            print(f"  Population Size: {self.population_size}")
+            print(f"  Maximum Generations: {self.max_generations}")
+
+        self.telemetry.start(type(self).__name__, population_size=self.population_size,
+                             max_generations=self.max_generations)
+        stopping_state = None if self.stopping is None else self.stopping.start(minimize=False)
+        if self.clonalg:
+            best_solution, best_value, best_weight = self._run_clonalg(stopping_state)
+        else:
+            best_solution, best_value, best_weight = self._run_generations(stopping_state)
+
+        self.telemetry.end(best_value, cache=None if self.cache is None else self.cache.stats())
+        if self.verbose:
+            print(f"Best Knapsack Solution:")
+            print(f"  Selected items: {best_solution}")
+            print(f"  Total weight: {best_weight}")
+            print(f"  Total value: {best_value}")
+            print("-" * 50)
+        return best_solution, best_value
+
+# objective is a sequencing objective from heuristics.scheduling, by default the total
+# completion time of the jobs in order. An antibody's state is the objective's prepare()
+# state of its order, built when the antibody is first mutated, and a swapped clone is
+# scored by the objective's swap_delta() from it. As clones never need a full evaluation,
+# cache_size only enables dropping duplicate clones, as in SetCoverAIS.
+class JobSchedulingAIS:
+    def __init__(self, job_durations: List[int], population_size: int, max_generations: int,
+                 clone_rate: float = 0.1, mutation_rate: float = 0.2,
+                 stopping: Optional[StoppingCriteria] = None, telemetry: Optional[Telemetry] = None,
+                 objective: Optional[Any] = None, cache_size: Optional[int] = None, verbose: bool = False):
+        self.job_durations = job_durations
+        self.objective = CompletionTime(job_durations) if objective is None else objective
+        self.population_size = population_size
+        self.max_generations = max_generations
+        self.clone_rate = clone_rate
+        self.mutation_rate = mutation_rate
+        self.stopping = stopping
+        self.telemetry = DISABLED if telemetry is None else telemetry
+        self.verbose = verbose
+        self.evaluations = 0
+        self.cache = None if cache_size is None else FitnessCache(sequence_key, cache_size)
+
+    def _initialize_population(self):
+        population = []
+        for _ in range(self.population_size):
+            solution = self._create_individual_solution()
+            population.append(self._evaluate(Antibody(solution)))
+        return population
+
+    def _create_individual_solution(self):
+        solution = list(range(len(self.job_durations)))
+        random.shuffle(solution)
+        return solution
+
+    def _clone_and_hypermutate(self, population):
+        clones = []
+        seen = None if self.cache is None else _population_keys(population, self.cache)
+        for solution in population:
+            if random.random() < self.clone_rate:
+                clone = solution.clone(solution.encoding.copy())
+                if random.random() < self.mutation_rate:
+                    # Mutation: Swap two random jobs
+                    order = clone.encoding
+                    idx1, idx2 = random.sample(range(len(order)), 2)
+                    if solution.state is None:
+                        solution.state = self.objective.prepare(solution.encoding)
+                    clone.fitness += self.objective.swap_delta(solution.encoding, solution.state, idx1, idx2)
+                    clone.state = None
+                    order[idx1], order[idx2] = order[idx2], order[idx1]
+                    self.evaluations += 1
+                if seen is not None and _is_duplicate_clone(clone, solution, self.cache, seen):
+                    continue
+                clones.append(self._evaluate(clone))
+        return population + clones
+
+    def _get_completion_time(self, solution):
+        return self.objective.evaluate(solution)
+
+    def _evaluate(self, antibody):
+        if antibody.fitness is None:
+            antibody.fitness = self._get_completion_time(antibody.encoding)
+            self.evaluations += 1
+        return antibody
+
+    def _select_population(self, population):
+        # Sort by completion time (minimize)
+        population.sort(key=lambda antibody: antibody.fitness)
+        return population[:self.population_size]
+
+    def run(self):
+        if self.verbose:
+            print(f"Job Scheduling AIS Configuration:")
+            print(f"  Job Durations: {self.job_durations}")
+            print(f"  Population Size: {self.population_size}")
+            print(f"  Maximum Generations: {self.max_generations}")
+
+        self.telemetry.start(type(self).__name__, population_size=self.population_size,
+                             max_generations=self.max_generations)
+        stopping_state = None if self.stopping is None else self.stopping.start(minimize=True)
+        self.evaluations = 0
+        population = self._initialize_population()
+        best = min(population, key=lambda antibody: antibody.fitness)
+        best_solution, best_completion_time = best.encoding, best.fitness
+        
+        for generation in range(self.max_generations):
+            evaluated = self.evaluations
+            population = self._clone_and_hypermutate(population)
+            evaluations = self.evaluations - evaluated
+            population = self._select_population(population)
+            
+            # The population is sorted by completion time
+            current_best = population[0]
+            current_completion_time = current_best.fitness
+            
+            if current_completion_time < best_completion_time:
+                best_solution = current_best.encoding
+                best_completion_time = current_completion_time
+
+            if self.telemetry.active:
+                self.telemetry.phase("selection", candidates=evaluations, best=current_completion_time)
+                self.telemetry.iteration(generation + 1, best_completion_time, evaluations=evaluations)
+            if stopping_state is not None and stopping_state.update(best_completion_time, evaluations):
+                break
+
+        self.telemetry.end(best_completion_time,
+                           cache=None if self.cache is None else {"duplicates": self.cache.duplicates})
+        if self.verbose:
+            print(f"Best Job Scheduling Solution:")
+            print(f"  Job order: {best_solution}")
+            print(f"  {self.objective.name}: {best_completion_time}")
+            print("-" * 50)
+        return best_solution, best_completion_time
+
+if __name__ == "__main__":
+    # Test Bin Packing
+    items = [5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55, 60]
+    bin_capacity = 20
+    population_size = 50
+    max_generations = 300
+    bin_packing = BinPackingAIS(items, bin_capacity, population_size, max_generations, verbose=True)
+    bin_packing.run()
+
+    # Test Set Cover
+    universe = {1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15}
+    subsets = [{1, 2, 3}, {2, 3, 4}, {4, 5, 6}, {6, 7, 8}, {8, 9, 10}, {10, 11, 12}, {13, 14, 15}]
+    set_cover = SetCoverAIS(universe, subsets, population_size, max_generations, verbose=True)
+    set_cover.run()
+
+    # Test Knapsack with more items and values
+    items_knapsack = [
+        (10, 60), (22, 100), (31, 120), (15, 150), (26, 200), (85, 250), (3, 300), (54, 350),
+        (40, 120), (70, 180), (55, 140), (45, 200), (65, 210), (30, 170), (80, 280), (60, 220),
+        (5, 90), (35, 150), (50, 180), (75, 260), (20, 110), (90, 310), (95, 320), (12, 130),
+        (72, 230), (100, 350), (55, 190), (68, 270), (85, 300), (42, 150), (88, 260), (92, 310),
+        (25, 140), (47, 170), (67, 240), (85, 290), (93, 330), (60, 200), (43, 160), (99, 370),
+        (29, 130), (95, 310), (77, 280), (62, 250), (49, 180), (60, 170), (73, 290), (80, 320)
+    ]
+    knapsack_capacity = 510
+    knapsack = KnapsackAIS(items_knapsack, knapsack_capacity, population_size, max_generations, verbose=True)
+    knapsack.run()
+
+    # Test Job Scheduling with more job durations
+    job_durations = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100, 110, 120, 130, 140, 150]
+    job_scheduling = JobSchedulingAIS(job_durations, population_size, max_generations, verbose=True)
+    job_scheduling.run()
\ No newline at end of file
@@ -0,0 +1,60 @@
+import random
+
+# Roulette-wheel selection over weights that change one at a time, kept in a Fenwick
+# (binary indexed) tree of prefix sums. update() and sample() are O(log n) and nothing is
+# ever renormalized: a draw is a uniform number in [0, total) located by descending the
+# tree. Items of weight 0 are never drawn.
+class WeightedSampler:
+    def __init__(self, weights):
+        self.weights = [float(w) for w in weights]
+        self.tree = [0.0] + self.weights
+        n = len(self.weights)
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                self.tree[parent] += self.tree[i]
+        self.top = 1 << (n.bit_length() - 1) if n else 0
+
+    def __len__(self):
+        return len(self.weights)
+
+    def copy(self):
+        sampler = WeightedSampler.__new__(WeightedSampler)
+        sampler.weights = self.weights.copy()
+        sampler.tree = self.tree.copy()
+        sampler.top = self.top
+        return sampler
+
+    def total(self):
+        total = 0.0
+        i = len(self.weights)
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def update(self, index, weight):
+        delta = weight - self.weights[index]
+        self.weights[index] = float(weight)
+        i = index + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def sample(self, rng=random):
+        total = self.total()
+        if total <= 0:
+            raise ValueError("cannot sample from weights that sum to zero")
+        target = rng.random() * total
+        position = 0
+        step = self.top
+        while step:
+            candidate = position + step
+            if candidate < len(self.tree) and self.tree[candidate] <= target:
+                target -= self.tree[candidate]
+                position = candidate
+            step >>= 1
+        # Rounding in the tree can push the descent past the last positive weight
+        if position >= len(self.weights) or self.weights[position] <= 0:
+            position = max(i for i, w in enumerate(self.weights) if w > 0)
+        return position
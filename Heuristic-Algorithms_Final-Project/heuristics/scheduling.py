@@ -0,0 +1,103 @@
+import heapq
+from itertools import accumulate, chain, islice
+from math import isqrt
+from operator import mul
+
+# Sequencing objectives for the permutation solvers (a solution is an order of job
+# indices). evaluate() scores an order from scratch. prepare() returns the state of an
+# order that swap_delta() and reverse_delta() use to score a neighbor without building
+# it: swapping the jobs at positions i and j, or reversing order[i:j]. Deltas are the
+# change of the objective, which is minimized.
+
+# Total weighted completion time, sum of weight * completion time over the jobs processed
+# one after the other in the given order (unit weights by default). The state holds prefix
+# sums over positions of durations, weights, weight * completion time and weight *
+# duration, so both moves are scored in O(1): a swap shifts the jobs between the two
+# positions by the difference of the swapped durations, and in a reversed segment
+# starting at S with total duration T a job completing at C completes at 2S + T - C + p.
+class CompletionTime:
+    def __init__(self, durations, weights=None):
+        self.durations = durations
+        self.weights = [1] * len(durations) if weights is None else weights
+        self.name = "Total completion time" if weights is None else "Total weighted completion time"
+
+    def evaluate(self, order):
+        return self.prepare(order)[2][-1]
+
+    def prepare(self, order):
+        durations = list(map(self.durations.__getitem__, order))
+        weights = list(map(self.weights.__getitem__, order))
+        starts = list(accumulate(durations, initial=0))
+        weighted_completion = list(accumulate(map(mul, weights, islice(starts, 1, None)), initial=0))
+        weighted_duration = list(accumulate(map(mul, weights, durations), initial=0))
+        return starts, list(accumulate(weights, initial=0)), weighted_completion, weighted_duration
+
+    def swap_delta(self, order, state, i, j):
+        if i > j:
+            i, j = j, i
+        starts, weights, _, _ = state
+        a, b = order[i], order[j]
+        pa, pb, wa, wb = self.durations[a], self.durations[b], self.weights[a], self.weights[b]
+        start, end = starts[i], starts[j + 1]
+        return ((wb - wa) * (start - end) + wb * pb - wa * pa
+                + (pb - pa) * (weights[j] - weights[i + 1]) if j > i else 0)
+
+    def reverse_delta(self, order, state, i, j):
+        starts, weights, weighted_completion, weighted_duration = state
+        start, total = starts[i], starts[j] - starts[i]
+        return ((2 * start + total) * (weights[j] - weights[i])
+                - 2 * (weighted_completion[j] - weighted_completion[i])
+                + weighted_duration[j] - weighted_duration[i])
+
+# Makespan on identical parallel machines of the list schedule of the order: each job in
+# turn goes to the machine that becomes free first. The state keeps the sorted machine
+# loads every isqrt(n) positions, so a neighbor is decoded from the last checkpoint before
+# its first changed position; past the changed segment the decode stops early as soon as
+# the loads at a checkpoint equal the original ones, since the rest of the schedule is
+# then the same.
+class Makespan:
+    def __init__(self, durations, machines):
+        self.durations = durations
+        self.machines = machines
+        self.name = "Makespan"
+
+    def evaluate(self, order):
+        loads = [0] * self.machines
+        for job in order:
+            heapq.heapreplace(loads, loads[0] + self.durations[job])
+        return max(loads)
+
+    def prepare(self, order):
+        stride = max(1, isqrt(len(order)))
+        loads = [0] * self.machines
+        checkpoints = []
+        for position, job in enumerate(order):
+            if position % stride == 0:
+                checkpoints.append(sorted(loads))
+            heapq.heapreplace(loads, loads[0] + self.durations[job])
+        return stride, checkpoints, max(loads)
+
+    def _delta(self, order, state, i, j, segment):
+        # segment replaces order[i:j]
+        stride, checkpoints, makespan = state
+        first = i // stride
+        loads = checkpoints[first].copy()
+        position = first * stride
+        for job in chain(order[position:i], segment, islice(order, j, None)):
+            if position % stride == 0 and position >= j and sorted(loads) == checkpoints[position // stride]:
+                return 0
+            heapq.heapreplace(loads, loads[0] + self.durations[job])
+            position += 1
+        return max(loads) - makespan
+
+    def swap_delta(self, order, state, i, j):
+        if i == j:
+            return 0
+        if i > j:
+            i, j = j, i
+        return self._delta(order, state, i, j + 1, chain((order[j],), order[i + 1:j], (order[i],)))
+
+    def reverse_delta(self, order, state, i, j):
+        if j - i < 2:
+            return 0
+        return self._delta(order, state, i, j, reversed(order[i:j]))
@@ -0,0 +1,123 @@
+from functools import cached_property
+
+import numpy as np
+
+# A set cover instance in compact form. The elements of the universe are numbered 0..n-1
+# in sorted order (positions); elements of a subset that are not in the universe are
+# dropped. Subset i covers the positions indices[offsets[i]:offsets[i + 1]] (CSR), and
+# element_subsets[element_offsets[e]:element_offsets[e + 1]] are the subsets covering
+# position e, so both directions take memory proportional to the number of nonzeros.
+#
+# Each subset's coverage can also be had as a Python int with bit e set for every covered
+# position (masks). Unions, coverage tests and uncovered counts of a solution are then
+# bitwise ORs, ANDs and popcounts over n / 64 machine words instead of set operations.
+# The masks take memory proportional to subsets x n, so they are built on first use
+# (coverage(), gain(), masks) and solvers working on the CSR arrays never pay for them.
+class SetCoverInstance:
+    def __init__(self, universe, sets, costs=None):
+        self.elements = sorted(universe)
+        position = {element: i for i, element in enumerate(self.elements)}
+        covered = [sorted(position[element] for element in subset if element in position) for subset in sets]
+
+        self.num_elements = len(self.elements)
+        self.num_subsets = len(covered)
+        self.offsets = np.zeros(self.num_subsets + 1, dtype=np.int64)
+        np.cumsum([len(positions) for positions in covered], out=self.offsets[1:])
+        self.indices = np.fromiter((e for positions in covered for e in positions), dtype=np.int32,
+                                   count=self.offsets[-1])
+        self.costs = [1] * self.num_subsets if costs is None else list(costs)
+
+        # Transpose of the CSR arrays: subsets ordered by the positions they cover
+        order = np.argsort(self.indices, kind="stable")
+        self.rows = np.repeat(np.arange(self.num_subsets, dtype=np.int32), np.diff(self.offsets))
+        self.element_subsets = self.rows[order]
+        self.element_offsets = np.zeros(self.num_elements + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.indices, minlength=self.num_elements), out=self.element_offsets[1:])
+
+        self.universe_mask = (1 << self.num_elements) - 1
+
+    # From the {"set": ..., "cost": ...} dicts used by the solvers
+    @classmethod
+    def from_subsets(cls, universe, subsets):
+        return cls(universe, [subset["set"] for subset in subsets], [subset["cost"] for subset in subsets])
+
+    @cached_property
+    def masks(self):
+        return [self.positions_mask(self.subset(i)) for i in range(self.num_subsets)]
+
+    # Whether every position is covered by some subset
+    def coverable(self):
+        return bool((np.diff(self.element_offsets) > 0).all())
+
+    # The mask with the bits of positions set, the inverse of positions()
+    def positions_mask(self, positions):
+        positions = np.asarray(positions, dtype=np.int64)
+        data = np.zeros(self.num_elements + 7 >> 3, dtype=np.uint8)
+        np.bitwise_or.at(data, positions >> 3, (1 << (positions & 7)).astype(np.uint8))
+        return int.from_bytes(data.tobytes(), "little")
+
+    def __len__(self):
+        return self.num_subsets
+
+    def subset(self, i):
+        return self.indices[self.offsets[i]:self.offsets[i + 1]]
+
+    def subsets_covering(self, position):
+        return self.element_subsets[self.element_offsets[position]:self.element_offsets[position + 1]]
+
+    # The subsets covering any of positions (an array of distinct positions), with how many
+    # of them each covers: the drop in their gains when those positions become covered.
+    # The cost is the number of (position, subset) pairs touched, not the universe size.
+    def covering_counts(self, positions):
+        starts = self.element_offsets[positions]
+        lengths = self.element_offsets[positions + 1] - starts
+        # Concatenated ranges starts[k]:starts[k] + lengths[k] of element_subsets
+        shifts = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        subsets = self.element_subsets[np.arange(len(shifts)) + shifts]
+        return np.unique(subsets, return_counts=True)
+
+    # Per subset of rows (all subsets by default), the sum of values over the positions it
+    # covers, in one pass over the nonzeros of those subsets
+    def row_sums(self, values, rows=None):
+        if rows is None:
+            return np.bincount(self.rows, weights=values[self.indices], minlength=self.num_subsets)
+        starts = self.offsets[rows]
+        lengths = self.offsets[rows + 1] - starts
+        shifts = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        positions = self.indices[np.arange(len(shifts)) + shifts]
+        return np.bincount(np.repeat(np.arange(len(rows)), lengths), weights=values[positions], minlength=len(rows))
+
+    # How many subsets of solution cover each position
+    def coverage_counts(self, solution):
+        solution = np.asarray(solution, dtype=np.int64)
+        starts = self.offsets[solution]
+        lengths = self.offsets[solution + 1] - starts
+        shifts = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return np.bincount(self.indices[np.arange(len(shifts)) + shifts], minlength=self.num_elements)
+
+    def coverage(self, solution):
+        mask = 0
+        for i in solution:
+            mask |= self.masks[i]
+        return mask
+
+    def covers(self, solution):
+        return self.coverage(solution) == self.universe_mask
+
+    def uncovered_count(self, mask):
+        return self.num_elements - mask.bit_count()
+
+    def gain(self, i, mask):
+        # Positions of subset i not yet in mask
+        return (self.masks[i] & ~mask).bit_count()
+
+    def cost(self, solution):
+        return sum(self.costs[i] for i in solution)
+
+    def positions(self, mask):
+        # Set bits of mask, in increasing order
+        data = np.frombuffer(mask.to_bytes(self.num_elements + 7 >> 3, "little"), dtype=np.uint8)
+        return np.flatnonzero(np.unpackbits(data, bitorder="little"))
+
+    def uncovered_elements(self, solution):
+        return {self.elements[e] for e in self.positions(self.universe_mask & ~self.coverage(solution))}
@@ -0,0 +1,56 @@
+import time
+
+# Stopping criteria shared by every solver, on top of its own iteration/generation limit:
+# a wall-clock budget in seconds, a budget of objective evaluations, a number of
+# iterations without improving the incumbent, and a target objective value. Criteria
+# left as None are not checked. The same object can be passed to any number of runs;
+# each run gets its own counters from start().
+class StoppingCriteria:
+    def __init__(self, max_time=None, max_evaluations=None, max_stagnation=None, target=None):
+        self.max_time = max_time
+        self.max_evaluations = max_evaluations
+        self.max_stagnation = max_stagnation
+        self.target = target
+
+    def start(self, minimize=True):
+        return StoppingState(self, minimize)
+
+# Counters of one run. Solvers call update() once per iteration with the best score so
+# far and the number of evaluations the iteration used, and stop when it returns True.
+class StoppingState:
+    def __init__(self, criteria, minimize=True):
+        self.criteria = criteria
+        self.minimize = minimize
+        self.started = time.perf_counter()
+        self.deadline = None if criteria.max_time is None else self.started + criteria.max_time
+        self.evaluations = 0
+        self.iterations = 0
+        self.stagnation = 0
+        self.best_score = None
+
+    def improves(self, score, best_score):
+        return best_score is None or (score < best_score if self.minimize else score > best_score)
+
+    def update(self, best_score, evaluations=0):
+        self.iterations += 1
+        self.evaluations += evaluations
+        if self.improves(best_score, self.best_score):
+            self.best_score = best_score
+            self.stagnation = 0
+        else:
+            self.stagnation += 1
+        return self.should_stop()
+
+    def should_stop(self):
+        criteria = self.criteria
+        if criteria.target is not None and self.best_score is not None:
+            if self.best_score <= criteria.target if self.minimize else self.best_score >= criteria.target:
+                return True
+        if criteria.max_stagnation is not None and self.stagnation >= criteria.max_stagnation:
+            return True
+        if criteria.max_evaluations is not None and self.evaluations >= criteria.max_evaluations:
+            return True
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
@@ -0,0 +1,754 @@
+import heapq
+import operator
+import random
+from bisect import bisect_left, insort
+from collections import OrderedDict, deque
+
+from .telemetry import DISABLED
+
+# Tabu memory keyed by move attributes (a moved job and the machine it left, a flipped
+# bit, ...). Each attribute maps to the iteration at which it stops being tabu, so a
+# membership check is a dict lookup and tabu_size is simply the tenure in iterations.
+class TabuMemory:
+    def __init__(self, tenure):
+        self.tenure = tenure
+        self.expiry = {}
+
+    def is_tabu(self, attribute, iteration):
+        return self.expiry.get(attribute, -1) > iteration
+
+    def add(self, attribute, iteration):
+        self.expiry[attribute] = iteration + self.tenure
+
+# Reactive tabu search (Battiti and Tecchiolli): the tenure adapts instead of staying at
+# tabu_size. Solvers report the Zobrist hash of every solution they move to, and visited
+# maps each hash to the iteration it was last seen, so a cycle check is one dict lookup.
+# A repeated solution means the search is cycling and the tenure grows; once no solution
+# has repeated for longer than the average cycle length, it shrinks back.
+#
+# visited is kept in order of last visit and bounded: hashes not seen for more than
+# cycle_memory average cycles are dropped (a cycle that much longer than the usual ones
+# is not counted as a repetition), and at most max_visited hashes are kept.
+class ReactiveTabuMemory(TabuMemory):
+    def __init__(self, tenure, increase=1.1, decrease=0.9, min_tenure=1, max_tenure=None, cycle_memory=4,
+                 max_visited=100_000):
+        super().__init__(tenure)
+        self.increase = increase
+        self.decrease = decrease
+        self.min_tenure = min_tenure
+        self.max_tenure = max_tenure
+        self.cycle_memory = cycle_memory
+        self.max_visited = max_visited
+        self.visited = OrderedDict()
+        self.repetitions = 0
+        self.average_cycle = float(tenure)
+        self.last_change = 0
+
+    def visit(self, solution_hash, iteration):
+        visited = self.visited
+        last_visit = visited.pop(solution_hash, None)
+        visited[solution_hash] = iteration
+        horizon = iteration - self.cycle_memory * self.average_cycle
+        while len(visited) > self.max_visited or next(iter(visited.values())) < horizon:
+            visited.popitem(last=False)
+        if last_visit is not None:
+            self.repetitions += 1
+            self.average_cycle = 0.1 * (iteration - last_visit) + 0.9 * self.average_cycle
+            self.tenure = max(self.tenure + 1, int(self.tenure * self.increase))
+            if self.max_tenure is not None:
+                self.tenure = min(self.tenure, self.max_tenure)
+            self.last_change = iteration
+        elif iteration - self.last_change > self.average_cycle:
+            self.tenure = max(self.min_tenure, min(self.tenure - 1, int(self.tenure * self.decrease)))
+            self.last_change = iteration
+        return last_visit is not None
+
+def _tabu_memory(tabu_size, reactive, num_attributes):
+    # A reactive tenure is capped at half the attributes so that moves always remain
+    # available: one attribute becomes tabu per iteration, so at most half are tabu at once
+    if reactive:
+        return ReactiveTabuMemory(tabu_size, max_tenure=max(tabu_size, num_attributes // 2))
+    return TabuMemory(tabu_size)
+
+_MASK64 = (1 << 64) - 1
+
+# 64-bit Zobrist key of a solution attribute (a selected index, a (job, machine) pair,
+# ...), derived with the splitmix64 mixer instead of being drawn and stored in a table.
+# A solution hash is the XOR of the keys of its attributes, so a move updates it in O(1).
+def _zobrist_key(*attribute):
+    x = (hash(attribute) + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+# Per-iteration trace of a tabu run. history_size=None keeps every iteration, an integer
+# keeps only the most recent ones in a ring buffer (0 keeps none), and callback receives
+# each history entry as it is produced, so a run can be streamed in constant memory.
+class TabuTrace:
+    def __init__(self, history_size=None, callback=None):
+        self.history = [] if history_size is None else deque(maxlen=history_size)
+        self.population = [] if history_size is None else deque(maxlen=history_size)
+        self.callback = callback
+        self.enabled = history_size != 0 or callback is not None
+
+    def record(self, solution, entry):
+        self.population.append(solution)
+        self.history.append(entry)
+        if self.callback is not None:
+            self.callback(entry)
+
+    def result(self):
+        return list(self.history), list(self.population)
+
+# Candidate list strategy for large neighborhoods. Instead of the whole neighborhood, each
+# iteration scores `size` randomly sampled moves. With elite_size set, the best elite_size
+# moves of a sample are kept and only they are re-scored until the list is rebuilt from a
+# fresh sample every refresh_every iterations, so an iteration never costs more than
+# scoring `size` moves whatever the instance size.
+class CandidateList:
+    def __init__(self, size, elite_size=None, refresh_every=1):
+        self.size = size
+        self.elite_size = elite_size
+        self.refresh_every = refresh_every
+        self.elite = []
+        self.refreshing = True
+
+    def moves(self, iteration, sample):
+        self.refreshing = (self.elite_size is None or not self.elite
+                           or iteration % self.refresh_every == 0)
+        return sample(self.size) if self.refreshing else self.elite
+
+    def update(self, ranked_moves):
+        # ranked_moves are the moves returned by moves(), best first
+        if self.refreshing and self.elite_size is not None:
+            self.elite = ranked_moves[:self.elite_size]
+
+def _candidate_list(candidate_size, elite_size, refresh_every):
+    return None if candidate_size is None else CandidateList(candidate_size, elite_size, refresh_every)
+
+# Move selection over a lazily scored neighborhood: scored_moves yields (score, move...)
+# entries and admissible(entry) tells whether a move may be taken (not tabu, or aspirated).
+# "best" keeps the top_k admissible entries in a heap and takes the best of them, which
+# picks the same move as sorting the whole neighborhood. "first" stops scoring at the
+# first admissible entry improving on current_score, which is then the best one kept;
+# without one it falls back to the best admissible entry. Memory is O(top_k) and nothing
+# is sorted. Returns the chosen entry (or None), the kept entries best first (used to
+# refill elite candidate lists) and the number of entries scored.
+def _select_move(scored_moves, admissible, selection, current_score, top_k=1, minimize=True):
+    better = operator.lt if minimize else operator.gt
+    evaluated = 0
+
+    def scan():
+        nonlocal evaluated
+        for entry in scored_moves:
+            evaluated += 1
+            if admissible(entry):
+                yield entry
+                if selection == "first" and better(entry[0], current_score):
+                    return
+
+    if selection not in ("best", "first"):
+        raise ValueError(f"unknown selection {selection!r}, expected 'best' or 'first'")
+    keep = heapq.nsmallest if minimize else heapq.nlargest
+    ranked = keep(top_k, scan(), key=lambda entry: entry[0])
+    return (ranked[0] if ranked else None), ranked, evaluated
+
+# 1. Job Scheduling Problem
+def job_scheduling_tabu(job_times, num_machines, num_iterations, tabu_size,
+                        history_size=None, callback=None,
+                        candidate_size=None, elite_size=None, refresh_every=1, stopping=None,
+                        selection="best", reactive=False, telemetry=None):
+    def evaluate(schedule):
+        return max([sum(job_times[job] for job in machine) for machine in schedule])
+
+    def score_move(i, j):
+        # Makespan after moving the head job of machine i to machine j, scored from the
+        # load totals in O(1): only loads[i] and loads[j] change, so the rest of the
+        # makespan is the largest of the three heaviest machines other than i and j.
+        job_time = job_times[schedule[i][0]]
+        rest = next((load for load, k in reversed(ranked[-3:]) if k != i and k != j), 0)
+        return max(loads[i] - job_time, loads[j] + job_time, rest)
+
+    def all_moves():
+        return ((i, j) for i in range(num_machines) if schedule[i] for j in range(num_machines) if i != j)
+
+    def admissible(entry):
+        score, i, j = entry
+        # Moving a job back onto a machine it recently left is tabu
+        return not tabu_memory.is_tabu((schedule[i][0], j), iteration) or score < best_score
+
+    def sample_moves(size):
+        if num_machines < 2:
+            return []
+        moves = []
+        for _ in range(size):
+            i = random.randrange(num_machines)
+            j = random.randrange(num_machines - 1)
+            moves.append((i, j + (j >= i)))
+        return moves
+
+    def apply_move(i, j):
+        job = schedule[i].popleft()
+        schedule[j].append(job)
+        for machine in (i, j):
+            del ranked[bisect_left(ranked, (loads[machine], machine))]
+        loads[i] -= job_times[job]
+        loads[j] += job_times[job]
+        insort(ranked, (loads[i], i))
+        insort(ranked, (loads[j], j))
+
+    schedule = [deque() for _ in range(num_machines)]
+    for i, job_time in enumerate(job_times):
+        schedule[i % num_machines].append(i)
+
+    # Machine loads, and the same loads kept sorted to find the heaviest machines
+    loads = [sum(job_times[job] for job in machine) for machine in schedule]
+    ranked = sorted((load, i) for i, load in enumerate(loads))
+    tabu_memory = _tabu_memory(tabu_size, reactive, len(job_times))
+    telemetry = DISABLED if telemetry is None else telemetry
+    telemetry.start("job_scheduling_tabu")
+    if reactive:
+        schedule_hash = 0
+        for i, machine in enumerate(schedule):
+            for job in machine:
+                schedule_hash ^= _zobrist_key(job, i)
+    candidates = _candidate_list(candidate_size, elite_size, refresh_every)
+    best_schedule = [list(machine) for machine in schedule]
+    best_score = evaluate(schedule)
+    trace = TabuTrace(history_size, callback)
+    trace.population.append(best_schedule)
+    run = None if stopping is None else stopping.start(minimize=True)
+
+    top_k = 1 if elite_size is None else elite_size
+
+    for iteration in range(num_iterations):
+        moves = all_moves() if candidates is None else candidates.moves(iteration, sample_moves)
+        move, elite, evaluated = _select_move(((score_move(i, j), i, j) for i, j in moves if schedule[i]),
+                                              admissible, selection, ranked[-1][0], top_k)
+        if candidates is not None:
+            candidates.update([(i, j) for _, i, j in elite])
+
+        if move is not None:
+            score, i, j = move
+            job = schedule[i][0]
+            apply_move(i, j)
+            tabu_memory.add((job, i), iteration)
+            if reactive:
+                schedule_hash ^= _zobrist_key(job, i) ^ _zobrist_key(job, j)
+                tabu_memory.visit(schedule_hash, iteration)
+            if score < best_score:
+                best_schedule = [list(machine) for machine in schedule]
+                best_score = score
+
+        if trace.enabled:
+            trace.record([list(machine) for machine in schedule],
+                         (iteration, [[job_times[job] for job in machine] for machine in schedule], best_score))
+
+        if telemetry.active:
+            telemetry.iteration(iteration + 1, best_score, evaluations=evaluated, tenure=tabu_memory.tenure)
+
+        if run is not None and run.update(best_score, evaluated):
+            break
+
+    telemetry.end(best_score)
+    return trace.result()
+
+# 2. Knapsack Problem
+def knapsack_tabu(values, weights, capacity, num_iterations, tabu_size, vectorized=False,
+                  history_size=None, callback=None,
+                  candidate_size=None, elite_size=None, refresh_every=1, stopping=None, selection="best",
+                  reactive=False, telemetry=None):
+    telemetry = DISABLED if telemetry is None else telemetry
+    telemetry.start("knapsack_tabu")
+    trace = TabuTrace(history_size, callback)
+    candidates = _candidate_list(candidate_size, elite_size, refresh_every)
+    run = None if stopping is None else stopping.start(minimize=False)
+    tabu_memory = _tabu_memory(tabu_size, reactive, len(values))
+    if vectorized:
+        return _knapsack_tabu_vectorized(values, weights, capacity, num_iterations, tabu_memory, trace, candidates,
+                                         run, selection, telemetry)
+
+    def evaluate(total_value, total_weight):
+        return total_value if total_weight <= capacity else 0
+
+    def score_flip(i):
+        sign = -1 if solution[i] else 1
+        return evaluate(total_value + sign * values[i], total_weight + sign * weights[i])
+
+    def sample_flips(size):
+        return random.sample(range(len(values)), min(size, len(values)))
+
+    def admissible(entry):
+        score, i = entry
+        return not tabu_memory.is_tabu(i, iteration) or score > best_score
+
+    solution = [random.randint(0, 1) for _ in range(len(values))]
+    total_value = sum(v for v, s in zip(values, solution) if s)
+    total_weight = sum(w for w, s in zip(weights, solution) if s)
+    if reactive:
+        solution_hash = 0
+        for i, s in enumerate(solution):
+            if s:
+                solution_hash ^= _zobrist_key(i)
+    best_solution = solution[:]
+    best_score = evaluate(total_value, total_weight)
+    trace.population.append(best_solution)
+
+    top_k = 1 if elite_size is None else elite_size
+
+    for iteration in range(num_iterations):
+        flips = range(len(values)) if candidates is None else candidates.moves(iteration, sample_flips)
+        move, elite, evaluated = _select_move(((score_flip(i), i) for i in flips), admissible, selection,
+                                              evaluate(total_value, total_weight), top_k, minimize=False)
+        if candidates is not None:
+            candidates.update([i for _, i in elite])
+
+        if move is not None:
+            score, i = move
+            sign = -1 if solution[i] else 1
+            solution[i] = 1 - solution[i]
+            total_value += sign * values[i]
+            total_weight += sign * weights[i]
+            tabu_memory.add(i, iteration)
+            if reactive:
+                solution_hash ^= _zobrist_key(i)
+                tabu_memory.visit(solution_hash, iteration)
+            if score > best_score:
+                best_solution = solution[:]
+                best_score = score
+
+        if trace.enabled:
+            solution_copy = solution[:]
+            trace.record(solution_copy, (iteration, solution_copy, {
+                "selected_items": [i for i, s in enumerate(solution) if s],
+                "total_value": total_value,
+                "total_weight": total_weight
+            }))
+
+        if telemetry.active:
+            telemetry.iteration(iteration + 1, best_score, evaluations=evaluated, tenure=tabu_memory.tenure)
+
+        if run is not None and run.update(best_score, evaluated):
+            break
+
+    telemetry.end(best_score)
+    return trace.result()
+
+# Counterpart of _select_move for the vectorized solvers, where every flip is already
+# scored: the admissible positions the selection looks at, i.e. all of them for "best"
+# and those up to the first improving one for "first".
+def _scanned_flips(np, admissible, scores, selection, current_score, minimize=True):
+    if selection == "first":
+        improving = scores[admissible] < current_score if minimize else scores[admissible] > current_score
+        if improving.any():
+            return admissible[:np.argmax(improving) + 1]
+    elif selection != "best":
+        raise ValueError(f"unknown selection {selection!r}, expected 'best' or 'first'")
+    return admissible
+
+# NumPy version of knapsack_tabu: the solution is a bool array with running value and
+# weight totals, and all n one-flip neighbors are scored in a single vectorized pass.
+def _knapsack_tabu_vectorized(values, weights, capacity, num_iterations, tabu_memory, trace, candidates, run,
+                              selection, telemetry):
+    import numpy as np
+
+    def sample_flips(size):
+        return random.sample(range(len(values)), min(size, len(values)))
+
+    values = np.asarray(values)
+    weights = np.asarray(weights)
+    all_flips = np.arange(len(values))
+    solution = np.array([random.randint(0, 1) for _ in range(len(values))], dtype=bool)
+    total_value = values[solution].sum().item()
+    total_weight = weights[solution].sum().item()
+    tabu_expiry = np.full(len(values), -1)
+    reactive = isinstance(tabu_memory, ReactiveTabuMemory)
+    if reactive:
+        solution_hash = 0
+        for i in np.flatnonzero(solution).tolist():
+            solution_hash ^= _zobrist_key(i)
+    best_solution = solution.astype(int).tolist()
+    best_score = total_value if total_weight <= capacity else 0
+    trace.population.append(best_solution)
+
+    for iteration in range(num_iterations):
+        flips = all_flips if candidates is None else np.array(candidates.moves(iteration, sample_flips), dtype=int)
+        sign = np.where(solution[flips], -1, 1)
+        new_values = total_value + sign * values[flips]
+        new_weights = total_weight + sign * weights[flips]
+        scores = np.where(new_weights <= capacity, new_values, 0)
+
+        admissible = np.flatnonzero((tabu_expiry[flips] <= iteration) | (scores > best_score))
+        admissible = _scanned_flips(np, admissible, scores, selection,
+                                    total_value if total_weight <= capacity else 0, minimize=False)
+        if candidates is not None:
+            candidates.update(flips[admissible[np.argsort(-scores[admissible], kind="stable")]].tolist())
+        if len(admissible):
+            move = admissible[np.argmax(scores[admissible])]
+            i = flips[move]
+            solution[i] = not solution[i]
+            total_value = new_values[move].item()
+            total_weight = new_weights[move].item()
+            tabu_expiry[i] = iteration + tabu_memory.tenure
+            if reactive:
+                solution_hash ^= _zobrist_key(i.item())
+                tabu_memory.visit(solution_hash, iteration)
+            if scores[move] > best_score:
+                best_solution = solution.astype(int).tolist()
+                best_score = scores[move].item()
+
+        if trace.enabled:
+            solution_list = solution.astype(int).tolist()
+            trace.record(solution_list, (iteration, solution_list, {
+                "selected_items": np.flatnonzero(solution).tolist(),
+                "total_value": total_value,
+                "total_weight": total_weight
+            }))
+
+        if telemetry.active:
+            telemetry.iteration(iteration + 1, best_score, evaluations=len(flips), tenure=tabu_memory.tenure)
+
+        if run is not None and run.update(best_score, len(flips)):
+            break
+
+    telemetry.end(best_score)
+    return trace.result()
+
+# 3. Bin Packing Problem
+def bin_packing_tabu(items, bin_capacity, num_iterations, tabu_size, history_size=None, callback=None,
+                     candidate_size=None, elite_size=None, refresh_every=1, stopping=None, selection="best",
+                     reactive=False, telemetry=None):
+    # Bins are kept by id as lists of item indices with a load per bin. residuals is a
+    # sorted list of (bin_capacity - load, bin id), so the bins an item fits into are the
+    # suffix found by bisect, tightest first. Bins that become empty are dropped.
+    def evaluate(bins):
+        return len(bins)
+
+    def snapshot():
+        return [[items[k] for k in bin_items] for bin_items in bins.values()]
+
+    def best_target(k, iteration):
+        # Best admissible move of item k to another bin it fits into. Moves are ranked by
+        # the bin count they leave and then by how much they raise the sum of squared
+        # loads, which favours emptying lightly loaded bins into tightly packed ones.
+        source = item_bin[k]
+        size = items[k]
+        num_bins = len(bins) - 1 if len(bins[source]) == 1 else len(bins)
+        for position in range(bisect_left(residuals, (size, -1)), len(residuals)):
+            target = residuals[position][1]
+            if target != source and (not tabu_memory.is_tabu((k, target), iteration)
+                                     or num_bins < best_score):
+                return (num_bins, size * (loads[source] - loads[target] - size)), k, source, target
+        return None
+
+    def sample_items(size):
+        return random.sample(range(len(items)), min(size, len(items)))
+
+    def remove_residual(b):
+        del residuals[bisect_left(residuals, (bin_capacity - loads[b], b))]
+
+    def apply_move(k, source, target):
+        remove_residual(source)
+        remove_residual(target)
+        bins[source].remove(k)
+        loads[source] -= items[k]
+        bins[target].append(k)
+        loads[target] += items[k]
+        item_bin[k] = target
+        insort(residuals, (bin_capacity - loads[target], target))
+        if bins[source]:
+            insort(residuals, (bin_capacity - loads[source], source))
+        else:
+            del bins[source], loads[source]
+
+    bins = {}
+    loads = {}
+    item_bin = []
+    for k, item in enumerate(items):
+        for b in bins:
+            if loads[b] + item <= bin_capacity:
+                bins[b].append(k)
+                loads[b] += item
+                item_bin.append(b)
+                break
+        else:
+            item_bin.append(len(loads))
+            bins[len(loads)] = [k]
+            loads[len(loads)] = item
+    residuals = sorted((bin_capacity - load, b) for b, load in loads.items())
+
+    tabu_memory = _tabu_memory(tabu_size, reactive, len(items))
+    telemetry = DISABLED if telemetry is None else telemetry
+    telemetry.start("bin_packing_tabu")
+    if reactive:
+        bins_hash = 0
+        for k, b in enumerate(item_bin):
+            bins_hash ^= _zobrist_key(k, b)
+    candidates = _candidate_list(candidate_size, elite_size, refresh_every)
+    best_bins = snapshot()
+    best_score = evaluate(bins)
+    trace = TabuTrace(history_size, callback)
+    trace.population.append(best_bins)
+    run = None if stopping is None else stopping.start(minimize=True)
+
+    top_k = 1 if elite_size is None else elite_size
+
+    for iteration in range(num_iterations):
+        moved_items = range(len(items)) if candidates is None else candidates.moves(iteration, sample_items)
+        # best_target only returns admissible moves
+        moves = (move for move in (best_target(k, iteration) for k in moved_items) if move is not None)
+        move, elite, evaluated = _select_move(moves, lambda entry: True, selection, (len(bins), 0), top_k)
+        if candidates is not None:
+            candidates.update([k for _, k, _, _ in elite])
+
+        if move is not None:
+            _, k, source, target = move
+            apply_move(k, source, target)
+            tabu_memory.add((k, source), iteration)
+            if reactive:
+                bins_hash ^= _zobrist_key(k, source) ^ _zobrist_key(k, target)
+                tabu_memory.visit(bins_hash, iteration)
+
+        if evaluate(bins) < best_score:
+            best_bins = snapshot()
+            best_score = evaluate(bins)
+
+        if trace.enabled:
+            bins_snapshot = snapshot()
+            trace.record(bins_snapshot, (iteration, bins_snapshot, best_score))
+
+        if telemetry.active:
+            telemetry.iteration(iteration + 1, best_score, evaluations=evaluated, tenure=tabu_memory.tenure)
+
+        if run is not None and run.update(best_score, evaluated):
+            break
+
+    telemetry.end(best_score)
+    return trace.result()
+
+# 4. Set Cover Problem
+def set_cover_tabu(universe, subsets, num_iterations, tabu_size, vectorized=False,
+                   history_size=None, callback=None,
+                   candidate_size=None, elite_size=None, refresh_every=1, stopping=None, selection="best",
+                   reactive=False, telemetry=None):
+    telemetry = DISABLED if telemetry is None else telemetry
+    telemetry.start("set_cover_tabu")
+    trace = TabuTrace(history_size, callback)
+    candidates = _candidate_list(candidate_size, elite_size, refresh_every)
+    run = None if stopping is None else stopping.start(minimize=True)
+    tabu_memory = _tabu_memory(tabu_size, reactive, len(subsets))
+    if vectorized:
+        return _set_cover_tabu_vectorized(universe, subsets, num_iterations, tabu_memory, trace, candidates, run,
+                                          selection, telemetry)
+
+    # coverage counts how many selected subsets cover each element, so flipping subset i
+    # is scored from the counts of its own elements only
+    def score_flip(i):
+        if solution[i]:
+            return uncovered + sum(1 for e in members[i] if coverage[e] == 1)
+        return uncovered - sum(1 for e in members[i] if coverage[e] == 0)
+
+    def sample_flips(size):
+        return random.sample(range(len(subsets)), min(size, len(subsets)))
+
+    def admissible(entry):
+        score, i = entry
+        return not tabu_memory.is_tabu(i, iteration) or score < best_score
+
+    members = [list(universe.intersection(subset)) for subset in subsets]
+    solution = [random.randint(0, 1) for _ in range(len(subsets))]
+    coverage = {e: 0 for e in universe}
+    for i, s in enumerate(solution):
+        if s:
+            for e in members[i]:
+                coverage[e] += 1
+    uncovered = sum(1 for count in coverage.values() if count == 0)
+    if reactive:
+        solution_hash = 0
+        for i, s in enumerate(solution):
+            if s:
+                solution_hash ^= _zobrist_key(i)
+    best_solution = solution[:]
+    best_score = uncovered
+    trace.population.append(best_solution)
+
+    top_k = 1 if elite_size is None else elite_size
+
+    for iteration in range(num_iterations):
+        flips = range(len(subsets)) if candidates is None else candidates.moves(iteration, sample_flips)
+        move, elite, evaluated = _select_move(((score_flip(i), i) for i in flips), admissible, selection,
+                                              uncovered, top_k)
+        if candidates is not None:
+            candidates.update([i for _, i in elite])
+
+        if move is not None:
+            score, i = move
+            change = -1 if solution[i] else 1
+            for e in members[i]:
+                coverage[e] += change
+            solution[i] = 1 - solution[i]
+            uncovered = score
+            tabu_memory.add(i, iteration)
+            if reactive:
+                solution_hash ^= _zobrist_key(i)
+                tabu_memory.visit(solution_hash, iteration)
+            if score < best_score:
+                best_solution = solution[:]
+                best_score = score
+
+        if trace.enabled:
+            solution_copy = solution[:]
+            trace.record(solution_copy, (iteration, solution_copy, {
+                "selected_subsets": [i for i, s in enumerate(solution) if s],
+                "uncovered_elements": {e for e, count in coverage.items() if count == 0}
+            }))
+
+        if telemetry.active:
+            telemetry.iteration(iteration + 1, best_score, evaluations=evaluated, tenure=tabu_memory.tenure)
+
+        if run is not None and run.update(best_score, evaluated):
+            break
+
+    telemetry.end(best_score)
+    return trace.result()
+
+# NumPy version of set_cover_tabu on the CSR arrays of a SetCoverInstance, keeping per
+# element how many selected subsets cover it. Adding subset i covers its elements whose
+# count is 0 and removing it uncovers those whose count is 1, so all flips are scored with
+# two sums over the nonzeros of the flipped subsets. Only the CSR arrays are read, so the
+# instance never builds its per-subset bitmasks and setup stays proportional to the
+# nonzeros.
+def _set_cover_tabu_vectorized(universe, subsets, num_iterations, tabu_memory, trace, candidates, run,
+                               selection, telemetry):
+    import numpy as np
+
+    from .set_cover import SetCoverInstance
+
+    def sample_flips(size):
+        return random.sample(range(len(subsets)), min(size, len(subsets)))
+
+    instance = SetCoverInstance(universe, subsets)
+    elements = instance.elements
+
+    all_flips = np.arange(len(subsets))
+    solution = np.array([random.randint(0, 1) for _ in range(len(subsets))], dtype=bool)
+    coverage = instance.coverage_counts(np.flatnonzero(solution))
+    uncovered = np.count_nonzero(coverage == 0)
+    tabu_expiry = np.full(len(subsets), -1)
+    reactive = isinstance(tabu_memory, ReactiveTabuMemory)
+    if reactive:
+        solution_hash = 0
+        for i in np.flatnonzero(solution).tolist():
+            solution_hash ^= _zobrist_key(i)
+    best_solution = solution.astype(int).tolist()
+    best_score = uncovered
+    trace.population.append(best_solution)
+
+    for iteration in range(num_iterations):
+        if candidates is None:
+            flips, rows = all_flips, None
+        else:
+            flips = rows = np.array(candidates.moves(iteration, sample_flips), dtype=np.int64)
+        gained = instance.row_sums(coverage == 0, rows).astype(np.int64)
+        lost = instance.row_sums(coverage == 1, rows).astype(np.int64)
+        scores = np.where(solution[flips], uncovered + lost, uncovered - gained)
+
+        admissible = np.flatnonzero((tabu_expiry[flips] <= iteration) | (scores < best_score))
+        admissible = _scanned_flips(np, admissible, scores, selection, uncovered)
+        if candidates is not None:
+            candidates.update(flips[admissible[np.argsort(scores[admissible], kind="stable")]].tolist())
+        if len(admissible):
+            move = admissible[np.argmin(scores[admissible])]
+            i = flips[move]
+            coverage[instance.subset(i)] += -1 if solution[i] else 1
+            solution[i] = not solution[i]
+            uncovered = scores[move].item()
+            tabu_expiry[i] = iteration + tabu_memory.tenure
+            if reactive:
+                solution_hash ^= _zobrist_key(i.item())
+                tabu_memory.visit(solution_hash, iteration)
+            if uncovered < best_score:
+                best_solution = solution.astype(int).tolist()
+                best_score = uncovered
+
+        if trace.enabled:
+            solution_list = solution.astype(int).tolist()
+            trace.record(solution_list, (iteration, solution_list, {
+                "selected_subsets": np.flatnonzero(solution).tolist(),
+                "uncovered_elements": {elements[k] for k in np.flatnonzero(coverage == 0)}
+            }))
+
+        if telemetry.active:
+            telemetry.iteration(iteration + 1, best_score, evaluations=len(flips), tenure=tabu_memory.tenure)
+
+        if run is not None and run.update(best_score, len(flips)):
+            break
+
+    telemetry.end(best_score)
+    return trace.result()
+
+if __name__ == "__main__":
+    from .telemetry import Telemetry
+
+    # Progress line every 50 iterations instead of printing the whole history
+    progress = Telemetry(progress_every=50)
+
+    # Test Examples
+    # Job Scheduling
+    job_times = [2, 5, 3, 7, 1, 4]
+    num_machines = 3
+    job_history, job_population = job_scheduling_tabu(job_times, num_machines, 300, 20, telemetry=progress)
+
+    # Knapsack
+    data = [
+        (10, 60), (22, 100), (31, 120), (15, 150), (26, 200), (85, 250), (3, 300), (54, 350),
+        (40, 120), (70, 180), (55, 140), (45, 200), (65, 210), (30, 170), (80, 280), (60, 220),
+        (5, 90), (35, 150), (50, 180), (75, 260), (20, 110), (90, 310), (95, 320), (12, 130),
+        (72, 230), (100, 350), (55, 190), (68, 270), (85, 300), (42, 150), (88, 260), (92, 310),
+        (25, 140), (47, 170), (67, 240), (85, 290), (93, 330), (60, 200), (43, 160), (99, 370),
+        (29, 130), (95, 310), (77, 280), (62, 250), (49, 180), (60, 170), (73, 290), (80, 320)
+    ]
+
+    # values ve weights listelerini ayır
+    values = [item[0] for item in data]
+    weights = [item[1] for item in data]
+    capacity = 510
+    knapsack_history, knapsack_population = knapsack_tabu(values, weights, capacity, 300, 20, telemetry=progress)
+
+    # Bin Packing
+    items = [5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55, 60]
+    bin_capacity = 10
+    bin_history, bin_population = bin_packing_tabu(items, bin_capacity, 300, 20, telemetry=progress)
+
+    # Set Cover
+    universe = {1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15}
+    subsets = [{1, 2, 3}, {2, 3, 4}, {4, 5, 6}, {6, 7, 8}, {8, 9, 10}, {10, 11, 12}, {13, 14, 15}]
+    set_cover_history, set_cover_population = set_cover_tabu(universe, subsets, 300, 20, telemetry=progress)
+
+    # Extracting best solutions
+    best_job_schedule = job_history[-1][1]
+    best_job_max_time = job_history[-1][2]
+
+    best_knapsack_solution = knapsack_history[-1][1]
+    best_knapsack_details = knapsack_history[-1][2]
+
+    best_bin_packing = bin_history[-1][1]
+    best_bin_count = bin_history[-1][2]
+
+    best_set_cover_solution = set_cover_history[-1][1]
+    best_set_cover_details = set_cover_history[-1][2]
+
+
+    # Results
+    print("Job Scheduling:")
+    print(f"Best Schedule: {best_job_schedule}, Max Time: {best_job_max_time}")
+
+    print("\nKnapsack:")
+    print(f"Best Solution: {best_knapsack_solution}, Details: {best_knapsack_details}")
+
+    print("\nBin Packing:")
+    print(f"Best Bins: {best_bin_packing}, Total Bins: {best_bin_count}")
+
+
+    print("\nSet Cover:")
+    print(f"Best Solution: {best_set_cover_solution}, Details: {best_set_cover_details}")
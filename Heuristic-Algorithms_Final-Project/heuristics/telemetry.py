@@ -0,0 +1,126 @@
+import json
+import sys
+import time
+
+# Event levels. A Telemetry records the events of its level and of every level below it.
+OFF = 0
+INCUMBENT = 1  # start and end of a run and every new best score
+ITERATION = 2  # one event per iteration with the best score and the solver's statistics
+PHASE = 3      # statistics of the phases inside an iteration (bee phases, cloning, ...)
+
+# Structured events of a solver run. Solvers take telemetry=None and then use DISABLED,
+# whose flags are all False, and guard every call with those flags, so a disabled run
+# never builds an event or formats a string. Events are dicts with the event name, the
+# solver name and the time since start(); they are buffered and written to the sink in
+# batches of batch_size. Phase events follow the iteration they belong to in the stream,
+# up to that iteration's own event.
+#
+# Progress lines are separate from the sink: with progress_every=n, every n-th iteration
+# prints one line to stream (stdout by default), also when no sink is given.
+class Telemetry:
+    def __init__(self, sink=None, level=ITERATION, batch_size=256, progress_every=None, stream=None):
+        self.sink = sink
+        self.level = level if sink is not None else OFF
+        self.batch_size = batch_size
+        self.progress_every = progress_every
+        self.stream = stream
+        self.incumbents = self.level >= INCUMBENT
+        self.iterations = self.level >= ITERATION
+        self.phases = self.level >= PHASE
+        self.active = self.incumbents or bool(progress_every)
+        self.buffer = []
+        self.solver = None
+        self.best = None
+        self.started = time.perf_counter()
+
+    def start(self, solver, **fields):
+        self.solver = solver
+        self.best = None
+        self.started = time.perf_counter()
+        if self.incumbents:
+            self.emit("start", **fields)
+
+    def iteration(self, iteration, best, **stats):
+        if best != self.best:
+            self.best = best
+            if self.incumbents:
+                self.emit("incumbent", iteration=iteration, best=best)
+        if self.iterations:
+            self.emit("iteration", iteration=iteration, best=best, **stats)
+        if self.progress_every and iteration % self.progress_every == 0:
+            print(f"{self.solver} iteration {iteration}: best={best}", file=self.stream or sys.stdout)
+
+    def phase(self, name, **stats):
+        if self.phases:
+            self.emit("phase", phase=name, **stats)
+
+    def end(self, best, **fields):
+        if self.incumbents:
+            self.emit("end", best=best, elapsed=time.perf_counter() - self.started, **fields)
+        self.flush()
+
+    def emit(self, event, **fields):
+        fields["event"] = event
+        fields["solver"] = self.solver
+        fields["time"] = time.perf_counter() - self.started
+        self.buffer.append(fields)
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.buffer and self.sink is not None:
+            self.sink.write(self.buffer)
+        self.buffer = []
+
+    def close(self):
+        self.flush()
+        if hasattr(self.sink, "close"):
+            self.sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+DISABLED = Telemetry()
+
+# Sinks receive the buffered events as a list
+
+class CallbackSink:
+    def __init__(self, callback):
+        self.callback = callback
+
+    def write(self, events):
+        self.callback(events)
+
+def _json_default(value):
+    # NumPy scalars and arrays, sets of selected indices
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return str(value)
+
+# One JSON object per line. file is a path, opened for writing, or an open text file
+class JSONLSink:
+    def __init__(self, file):
+        self.owned = isinstance(file, str)
+        self.file = open(file, "w", encoding="utf-8") if self.owned else file
+
+    def write(self, events):
+        self.file.write("".join(json.dumps(event, default=_json_default) + "\n" for event in events))
+
+    def close(self):
+        if self.owned:
+            self.file.close()
+
+# Human-readable lines: "time solver event key=value ..."
+class FileSink(JSONLSink):
+    def write(self, events):
+        lines = []
+        for event in events:
+            fields = " ".join(f"{key}={value}" for key, value in event.items()
+                              if key not in ("time", "solver", "event"))
+            lines.append(f"{event['time']:10.4f} {event['solver']} {event['event']} {fields}\n")
+        self.file.write("".join(lines))